@@ -19,11 +19,14 @@ from src.agent.orchestrator import AgentOrchestrator
 from src.agent.session_memory import SessionMemory
 from src.core.logger import log_event, setup_logger
 from src.core.logging_context import start_new_turn
+from src.core.rate_limiter import RateLimitExceeded
 from src.tools.flight_time_estimator import FlightTimeEstimator
 from src.tools.geocoding_tool import GeocodingTool
 from src.tools.places_tool import PlacesTool
 from src.tools.weather_tool import WeatherTool
 
+# Seconds between checks for a background summary that has not finished yet.
+SUMMARY_POLL_S = 0.5
 
 st.set_page_config(page_title="Location Recommender Agent", layout="wide")
 st.title("Location Recommender Agent")
@@ -53,7 +56,7 @@ def init_state() -> None:
         geocoding_tool = GeocodingTool(logger)
         weather_tool = WeatherTool(logger)
         places_tool = PlacesTool(logger)
-        flight_tool = FlightTimeEstimator(str(ROOT / "data" / "airports.csv"))
+        flight_tool = FlightTimeEstimator(os.getenv("AIRPORTS_PATH", str(ROOT / "data" / "airports.csv")))
         st.session_state.orchestrator = AgentOrchestrator(
             logger=logger,
             llm_client=llm_client,
@@ -95,7 +98,20 @@ def handle_chat_onboarding(
         )
         return True
 
-    rows = orchestrator.geocoding_tool.geocode(f"{city}, {country}", limit=3)
+    try:
+        rows = orchestrator.geocoding_tool.geocode(f"{city}, {country}", limit=3)
+    except RateLimitExceeded:
+        # Shared geocoder queue is full; keep onboarding open and ask the user to resend.
+        st.session_state.messages.append(
+            {
+                "role": "assistant",
+                "content": (
+                    "Location lookups are busy right now. "
+                    "Please send your city, country again in a few seconds."
+                ),
+            }
+        )
+        return True
     log_event(
         logger,
         "INFO",
@@ -137,7 +153,7 @@ def handle_chat_onboarding(
         )
         return True
 
-    memory.set_origin(city, country)
+    memory.set_origin(city, country, lat=rows[0]["lat"], lon=rows[0]["lon"])
     log_event(logger, "INFO", "onboarding_origin_saved", city=memory.origin_city, country=memory.origin_country)
     st.session_state.messages.append(
         {
@@ -225,6 +241,49 @@ def apply_feedback(memory: SessionMemory, feedback_text: str, recommendations: l
         )
 
 
+def run_with_streamed_summary(
+    orchestrator: AgentOrchestrator, user_text: str, memory: SessionMemory
+) -> dict:
+    # Render summary tokens as they arrive; the final result replaces them on rerun.
+    result: dict = {}
+    with st.chat_message("assistant"):
+        placeholder = st.empty()
+        streamed = ""
+        for event in orchestrator.stream(user_text, memory):
+            if event["type"] == "summary_delta":
+                streamed += event["text"]
+                placeholder.markdown(streamed + "▌")
+            elif event["type"] == "result":
+                result = event["result"]
+        placeholder.empty()
+    return result
+
+
+def take_finished_summary(msg: dict) -> bool:
+    # Non-blocking: False while the background summary is still being written.
+    future = msg["summary_future"]
+    if not future.done():
+        return False
+    try:
+        patched = future.result()
+    except Exception as exc:  # noqa: BLE001
+        log_event(st.session_state.logger, "WARN", "summary_patch_failed", error=str(exc))
+        patched = None
+    msg.pop("summary_future", None)
+    if patched:
+        msg["content"] = patched
+    return True
+
+
+@st.fragment(run_every=SUMMARY_POLL_S)
+def render_pending_summary(msg: dict) -> None:
+    # Background summaries time out inside the orchestrator, so this polling always ends.
+    if take_finished_summary(msg):
+        # A full rerun renders the patched text and drops this polling fragment.
+        st.rerun()
+    st.markdown(msg["content"])
+
+
 def capture_weather_preference(memory: SessionMemory, user_text: str) -> bool:
     lowered = user_text.lower()
     if "cold" in lowered:
@@ -364,7 +423,10 @@ def main() -> None:
 
     for msg in st.session_state.messages:
         with st.chat_message(msg["role"]):
-            st.markdown(msg["content"])
+            if msg.get("summary_future") is not None and not take_finished_summary(msg):
+                render_pending_summary(msg)
+            else:
+                st.markdown(msg["content"])
             if msg.get("data") and os.getenv("SHOW_DEBUG_PAYLOADS", "false").lower() == "true":
                 st.json(msg["data"])
 
@@ -471,7 +533,7 @@ def main() -> None:
 
         start_new_turn()
         try:
-            result = orchestrator.run(user_input, memory)
+            result = run_with_streamed_summary(orchestrator, user_input, memory)
         except Exception as exc:  # noqa: BLE001
             log_event(
                 st.session_state.logger,
@@ -511,6 +573,7 @@ def main() -> None:
                 {
                     "role": "assistant",
                     "content": result["summary"],
+                    "summary_future": result.get("summary_future"),
                     "data": {
                         "plan": result["plan"],
                         "recommendations": result["recommendations"],
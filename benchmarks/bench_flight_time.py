@@ -0,0 +1,55 @@
+"""Micro-benchmark: scalar FlightTimeEstimator.estimate_hours vs estimate_hours_many.
+
+Run from the repo root:
+    python -m benchmarks.bench_flight_time [--destinations 5000] [--airports data/airports.csv]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from pathlib import Path
+
+from src.tools.flight_time_estimator import FlightTimeEstimator
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--destinations", type=int, default=5000)
+    parser.add_argument("--airports", default=str(ROOT / "data" / "airports.csv"))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    estimator = FlightTimeEstimator(args.airports)
+    rng = random.Random(42)
+    lats = [rng.uniform(-60.0, 70.0) for _ in range(args.destinations)]
+    lons = [rng.uniform(-180.0, 180.0) for _ in range(args.destinations)]
+    origin = ("Tel Aviv", "Israel", 32.0853, 34.7818)
+
+    def scalar() -> list[float | None]:
+        return [
+            estimator.estimate_hours(origin[0], origin[1], lat, lon, origin_lat=origin[2], origin_lon=origin[3])
+            for lat, lon in zip(lats, lons)
+        ]
+
+    def vectorized() -> list[float | None]:
+        airport = estimator.resolve_origin(*origin)
+        return estimator.estimate_hours_many(airport, lats, lons)
+
+    assert scalar() == vectorized(), "scalar and vectorized estimates disagree"
+    print(f"airports={len(estimator.airports)} destinations={args.destinations} repeat={args.repeat}")
+    for name, func in (("scalar", scalar), ("vectorized", vectorized)):
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        print(f"{name:>10}: best {best * 1000:8.2f} ms  ({best / args.destinations * 1e6:6.2f} us/destination)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,63 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import os
+import random
 import re
-from dataclasses import dataclass
+import threading
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime
 from typing import Any
 
 from dateutil import parser as date_parser
 
 from src.agent.prompt_builder import build_intent_prompt
+from src.agent.slot_policy import REQUIRED_SLOTS_BY_INTENT
+from src.core.async_runtime import run_sync
+from src.core.cache import MemoryCache, PersistentCache, get_persistent_cache
 from src.core.logger import log_event
 
+INTENT_CACHE_TTL_S = 7 * 24 * 3600
+INTENT_CACHE_MAX_ENTRIES = 2000
+# Any edit to the intent prompt template changes this, so stale parses are never served.
+INTENT_PROMPT_VERSION = hashlib.sha256(build_intent_prompt("{user_text}").encode("utf-8")).hexdigest()[:12]
+
+_INTENT_CACHE: MemoryCache | PersistentCache | None = None
+
+# How sure the rules are about each slot, by how it was found.
+_SLOT_CONFIDENCE = {
+    "explicit": 1.0,  # "slot: value" drafts built by the clarification flow
+    "travel_date_or_month": 0.9,  # month names and d.m dates are unambiguous
+    "max_flight_hours": 0.9,
+    "activity": 0.8,  # keyword match ("ski")
+    "destination": 0.5,  # free-text "to X" / "in X" heuristics
+    "intent": 0.8,  # keyword-inferred intent, unless every required slot was explicit
+}
+_COMPARED_FIELDS = ("intent", "destination", "activity", "travel_date_or_month", "max_flight_hours")
+
+# Process-wide bypass/disagreement counters, shared by every session.
+_BYPASS_METRICS = {"parses": 0, "bypassed": 0, "sampled": 0, "disagreements": 0}
+_BYPASS_LOCK = threading.Lock()
+# Keeps fire-and-forget sampling tasks alive until they finish.
+_SAMPLING_TASKS: set[asyncio.Task[None]] = set()
+
+
+def get_intent_cache() -> MemoryCache | PersistentCache:
+    """Process-wide parse cache; on disk when ``INTENT_CACHE_PERSIST=true``."""
+    global _INTENT_CACHE
+    if _INTENT_CACHE is None:
+        if os.getenv("INTENT_CACHE_PERSIST", "false").lower() == "true":
+            _INTENT_CACHE = get_persistent_cache(
+                "intent",
+                max_entries=INTENT_CACHE_MAX_ENTRIES,
+                default_ttl_s=INTENT_CACHE_TTL_S,
+            )
+        else:
+            _INTENT_CACHE = MemoryCache(max_entries=INTENT_CACHE_MAX_ENTRIES)
+    return _INTENT_CACHE
+
 
 @dataclass
 class ParsedIntent:
@@ -29,30 +76,124 @@ class IntentParser:
         "constraint_based_discovery",
     }
 
-    def __init__(self, llm_client: Any, logger: Any) -> None:
+    def __init__(
+        self,
+        llm_client: Any,
+        logger: Any,
+        cache: MemoryCache | PersistentCache | None = None,
+    ) -> None:
         self.llm_client = llm_client
         self.logger = logger
+        # Parsing depends only on the text, so every session shares one cache.
+        self.cache = cache or get_intent_cache()
+        # Rules at or above this confidence skip the LLM; a sample still runs it to measure disagreement.
+        self.bypass_threshold = float(os.getenv("INTENT_RULE_CONFIDENCE_THRESHOLD", "0.9"))
+        self.disagreement_sample_rate = float(os.getenv("INTENT_DISAGREEMENT_SAMPLE_RATE", "0.05"))
 
     def parse(self, user_text: str) -> ParsedIntent:
+        return run_sync(self.aparse(user_text))
+
+    def parse_rules(self, user_text: str) -> ParsedIntent:
+        """Rules-only parse, no LLM call; cheap enough to run ahead of :meth:`aparse`."""
+        return self._normalize_intent(self._parse_with_rules(user_text))
+
+    def invalidate(self) -> None:
+        """Drop every cached parse, e.g. after changing parsing rules outside the prompt."""
+        self.cache.clear()
+        log_event(self.logger, "INFO", "intent_cache_invalidated", prompt_version=INTENT_PROMPT_VERSION)
+
+    async def aparse(self, user_text: str) -> ParsedIntent:
+        cache_key = self._cache_key(user_text)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            log_event(self.logger, "DEBUG", "intent_cache_hit", stats=self.cache.stats())
+            return ParsedIntent(**{**cached, "raw_text": user_text})
         # Deterministic fallback first, then optionally refine with LLM.
         parsed = self._parse_with_rules(user_text)
-        try:
-            prompt = build_intent_prompt(user_text)
-            llm_text = self.llm_client.generate_json(prompt, "intent_parser")
-            llm_data = json.loads(llm_text)
-            llm_intent = self._sanitize_llm_intent(llm_data.get("intent"))
-            merged = ParsedIntent(
-                intent=llm_intent or parsed.intent,
-                destination=llm_data.get("destination") or parsed.destination,
-                activity=llm_data.get("activity") or parsed.activity,
-                travel_date_or_month=llm_data.get("travel_date_or_month") or parsed.travel_date_or_month,
-                max_flight_hours=float(llm_data["max_flight_hours"]) if llm_data.get("max_flight_hours") is not None else parsed.max_flight_hours,
-                raw_text=user_text,
+        rules_result = self._normalize_intent(replace(parsed))
+        confidence = self._rule_confidence(user_text, rules_result)
+        bypass = confidence >= self.bypass_threshold
+        metrics = _record_parse(bypassed=bypass)
+        if bypass:
+            log_event(
+                self.logger,
+                "INFO",
+                "intent_llm_bypassed",
+                confidence=confidence,
+                threshold=self.bypass_threshold,
+                metrics=metrics,
             )
-            return self._normalize_intent(merged)
+            if random.random() < self.disagreement_sample_rate:
+                # Off the request path: the answer above is returned without waiting.
+                task = asyncio.create_task(self._sample_disagreement(user_text, parsed, rules_result))
+                _SAMPLING_TASKS.add(task)
+                task.add_done_callback(_SAMPLING_TASKS.discard)
+            return rules_result
+        try:
+            result = await self._parse_with_llm(user_text, parsed)
         except Exception as exc:  # noqa: BLE001
+            # Rules-only results are not cached, so the next turn retries the LLM.
             log_event(self.logger, "WARN", "intent_parser_llm_failed", error=str(exc))
-            return self._normalize_intent(parsed)
+            return rules_result
+        self.cache.set(cache_key, asdict(result), ttl_s=INTENT_CACHE_TTL_S)
+        return result
+
+    async def _parse_with_llm(self, user_text: str, parsed: ParsedIntent) -> ParsedIntent:
+        # LLM values win; rule values fill whatever the LLM left empty.
+        prompt = build_intent_prompt(user_text)
+        llm_text = await self.llm_client.agenerate_json(prompt, "intent_parser")
+        llm_data = json.loads(llm_text)
+        llm_intent = self._sanitize_llm_intent(llm_data.get("intent"))
+        merged = ParsedIntent(
+            intent=llm_intent or parsed.intent,
+            destination=llm_data.get("destination") or parsed.destination,
+            activity=llm_data.get("activity") or parsed.activity,
+            travel_date_or_month=llm_data.get("travel_date_or_month") or parsed.travel_date_or_month,
+            max_flight_hours=float(llm_data["max_flight_hours"]) if llm_data.get("max_flight_hours") is not None else parsed.max_flight_hours,
+            raw_text=user_text,
+        )
+        return self._normalize_intent(merged)
+
+    async def _sample_disagreement(self, user_text: str, parsed: ParsedIntent, rules_result: ParsedIntent) -> None:
+        try:
+            llm_result = await self._parse_with_llm(user_text, replace(parsed))
+        except Exception as exc:  # noqa: BLE001
+            log_event(self.logger, "DEBUG", "intent_disagreement_sample_failed", error=str(exc))
+            return
+        differing = differing_fields(rules_result, llm_result, _COMPARED_FIELDS)
+        metrics = _record_sample(disagreed=bool(differing))
+        log_event(
+            self.logger,
+            "INFO" if differing else "DEBUG",
+            "intent_parser_disagreement" if differing else "intent_parser_agreement",
+            fields=differing,
+            rules={field: getattr(rules_result, field) for field in differing},
+            llm={field: getattr(llm_result, field) for field in differing},
+            metrics=metrics,
+        )
+
+    def _rule_confidence(self, user_text: str, parsed: ParsedIntent) -> float:
+        # Weakest required slot decides; a missing one means the LLM may still find it.
+        explicit = self._extract_explicit_slots(user_text.lower())
+        required = REQUIRED_SLOTS_BY_INTENT.get(parsed.intent, [])
+        scores = []
+        for slot in required:
+            if getattr(parsed, slot, None) in (None, ""):
+                return 0.0
+            scores.append(self._slot_confidence(slot, explicit))
+        if not all(slot in explicit for slot in required):
+            scores.append(_SLOT_CONFIDENCE["intent"])
+        return min(scores, default=0.0)
+
+    def slot_confidence(self, user_text: str, slot: str) -> float:
+        """How sure the rules are about one slot they filled, by how it was found."""
+        return self._slot_confidence(slot, self._extract_explicit_slots(user_text.lower()))
+
+    def _slot_confidence(self, slot: str, explicit: dict[str, Any]) -> float:
+        return _SLOT_CONFIDENCE["explicit"] if slot in explicit else _SLOT_CONFIDENCE.get(slot, 0.5)
+
+    def _cache_key(self, user_text: str) -> str:
+        return f"{INTENT_PROMPT_VERSION}|{' '.join(user_text.lower().split())}"
 
     def _parse_with_rules(self, text: str) -> ParsedIntent:
         lowered = text.lower()
@@ -266,3 +407,38 @@ class IntentParser:
         if lowered in generic_tokens:
             return True
         return any(token in lowered for token in (" place", "destination", "somewhere", "anywhere"))
+
+
+def differing_fields(first: Any, second: Any, fields: tuple[str, ...]) -> list[str]:
+    """Fields whose values differ between two parsed intents, ignoring case and padding."""
+    return [field for field in fields if _comparable(getattr(first, field)) != _comparable(getattr(second, field))]
+
+
+def _comparable(value: Any) -> Any:
+    return value.strip().lower() if isinstance(value, str) else value
+
+
+def _record_parse(bypassed: bool) -> dict[str, Any]:
+    with _BYPASS_LOCK:
+        _BYPASS_METRICS["parses"] += 1
+        if bypassed:
+            _BYPASS_METRICS["bypassed"] += 1
+        return _metrics_snapshot_locked()
+
+
+def _record_sample(disagreed: bool) -> dict[str, Any]:
+    with _BYPASS_LOCK:
+        _BYPASS_METRICS["sampled"] += 1
+        if disagreed:
+            _BYPASS_METRICS["disagreements"] += 1
+        return _metrics_snapshot_locked()
+
+
+def _metrics_snapshot_locked() -> dict[str, Any]:
+    parses = _BYPASS_METRICS["parses"]
+    sampled = _BYPASS_METRICS["sampled"]
+    return {
+        **_BYPASS_METRICS,
+        "bypass_rate": round(_BYPASS_METRICS["bypassed"] / parses, 3) if parses else 0.0,
+        "disagreement_rate": round(_BYPASS_METRICS["disagreements"] / sampled, 3) if sampled else 0.0,
+    }
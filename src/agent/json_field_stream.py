@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+import re
+
+_HIGH_SURROGATE = re.compile(r"\\u[dD][89abAB][0-9a-fA-F]{2}$")
+
+
+class JsonStringFieldStream:
+    """Pulls one top-level string field out of a JSON object while it streams in."""
+
+    def __init__(self, field: str) -> None:
+        self._key = re.compile(r'"' + re.escape(field) + r'"\s*:\s*"')
+        self._buffer = ""
+        self._in_value = False
+        self.done = False
+        self.value = ""
+
+    def feed(self, chunk: str) -> str:
+        if self.done:
+            return ""
+        self._buffer += chunk
+        if not self._in_value:
+            match = self._key.search(self._buffer)
+            if not match:
+                # Keep a short tail in case the key straddles two chunks.
+                self._buffer = self._buffer[-64:]
+                return ""
+            self._buffer = self._buffer[match.end() :]
+            self._in_value = True
+        decoded = self._drain()
+        self.value += decoded
+        return decoded
+
+    def _drain(self) -> str:
+        out: list[str] = []
+        pos = 0
+        buffer = self._buffer
+        while pos < len(buffer):
+            char = buffer[pos]
+            if char == '"':
+                self.done = True
+                pos += 1
+                break
+            if char != "\\":
+                out.append(char)
+                pos += 1
+                continue
+            # Escapes are decoded only once complete; otherwise wait for the next chunk.
+            if pos + 1 >= len(buffer):
+                break
+            if buffer[pos + 1] != "u":
+                escape = buffer[pos : pos + 2]
+            else:
+                escape = buffer[pos : pos + 6]
+                if len(escape) < 6:
+                    break
+                if _HIGH_SURROGATE.match(escape):
+                    # A surrogate pair decodes as one character: need both halves.
+                    escape = buffer[pos : pos + 12]
+                    if len(escape) < 12:
+                        break
+            out.append(json.loads(f'"{escape}"'))
+            pos += len(escape)
+        self._buffer = buffer[pos:]
+        return "".join(out)
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import time
+import weakref
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 
 from dotenv import load_dotenv
-from groq import Groq
+from groq import AsyncGroq
 
+from src.agent.model_router import ModelRouter, classify_failure
+from src.core.async_runtime import run_sync
 from src.core.logger import log_event
 
 
@@ -18,7 +22,11 @@ class GroqClient:
         load_dotenv(dotenv_path=Path(__file__).resolve().parents[2] / ".env", override=False)
         api_key = os.getenv("GROQ_API_KEY", "")
         self.enabled = bool(api_key)
-        self.client = Groq(api_key=api_key) if api_key else None
+        self.api_key = api_key
+        # AsyncGroq wraps an httpx client bound to one event loop, so keep one per loop.
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncGroq] = (
+            weakref.WeakKeyDictionary()
+        )
         self.model_name = os.getenv("GROQ_MODEL", "llama-3.1-8b-instant")
         self.fallback_models = [
             self.model_name,
@@ -26,16 +34,21 @@ class GroqClient:
             "llama-3.3-70b-versatile",
         ]
         self.logger = logger
+        self.router = ModelRouter(self.fallback_models, logger)
         log_event(
             self.logger,
             "INFO",
             "llm_client_initialized",
             model=self.model_name,
             has_credentials=self.enabled,
+            deadlines_s=self.router.deadlines_s,
         )
 
     def generate_json(self, prompt: str, prompt_type: str) -> str:
-        if not self.enabled or self.client is None:
+        return run_sync(self.agenerate_json(prompt, prompt_type))
+
+    async def agenerate_json(self, prompt: str, prompt_type: str) -> str:
+        if not self.enabled:
             raise RuntimeError(
                 "Missing Groq API key. Set GROQ_API_KEY in your environment."
             )
@@ -48,36 +61,11 @@ class GroqClient:
             model=self.model_name,
             prompt=prompt,
         )
-        last_error: Exception | None = None
-        response = None
-        used_model = self.model_name
-        for candidate_model in self.fallback_models:
-            try:
-                response = self.client.chat.completions.create(
-                    model=candidate_model,
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.1,
-                    response_format={"type": "json_object"},
-                )
-                used_model = candidate_model
-                if candidate_model != self.model_name:
-                    log_event(
-                        self.logger,
-                        "WARN",
-                        "llm_model_fallback_used",
-                        requested_model=self.model_name,
-                        fallback_model=used_model,
-                    )
-                break
-            except Exception as exc:  # noqa: BLE001
-                last_error = exc
-                error_text = str(exc)
-                if "NOT_FOUND" not in error_text and "not found" not in error_text.lower():
-                    raise
-        if response is None:
-            if last_error is not None:
-                raise last_error
-            raise RuntimeError("Groq call failed with unknown error.")
+        response, used_model = await self._create_routed(
+            prompt,
+            prompt_type,
+            response_format={"type": "json_object"},
+        )
         text = (response.choices[0].message.content or "").strip()
         log_event(
             self.logger,
@@ -91,6 +79,115 @@ class GroqClient:
         cleaned = _extract_json(text)
         return cleaned
 
+    async def astream_json(self, prompt: str, prompt_type: str) -> AsyncIterator[str]:
+        """Yield raw content deltas of a JSON-answering completion as they arrive."""
+        if not self.enabled:
+            raise RuntimeError(
+                "Missing Groq API key. Set GROQ_API_KEY in your environment."
+            )
+        start = time.time()
+        log_event(
+            self.logger,
+            "DEBUG",
+            "llm_request",
+            prompt_type=prompt_type,
+            model=self.model_name,
+            prompt=prompt,
+            stream=True,
+        )
+        # JSON mode is not combined with streaming; the prompt contract already asks for JSON only.
+        stream, used_model = await self._create_routed(prompt, prompt_type, stream=True)
+        first_token_s: float | None = None
+        parts: list[str] = []
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if not delta:
+                continue
+            if first_token_s is None:
+                first_token_s = time.time() - start
+            parts.append(delta)
+            yield delta
+        log_event(
+            self.logger,
+            "DEBUG",
+            "llm_response",
+            prompt_type=prompt_type,
+            model=used_model,
+            stream=True,
+            ttft_ms=int(first_token_s * 1000) if first_token_s is not None else None,
+            latency_ms=int((time.time() - start) * 1000),
+            response="".join(parts),
+        )
+
+    async def _create_routed(self, prompt: str, prompt_type: str, **options: Any) -> tuple[Any, str]:
+        # Tries models in router order, failing over on timeouts, 5xx, 429 and missing models.
+        # For streams the deadline covers opening the stream, i.e. until the first response.
+        client = self._client()
+        deadline_s = self.router.deadline_s(prompt_type)
+        candidates = self.router.route(prompt_type)
+        last_error: Exception | None = None
+        for candidate_model in candidates:
+            if not self.router.try_acquire(candidate_model):
+                continue
+            start = time.time()
+            try:
+                response = await asyncio.wait_for(
+                    client.chat.completions.create(
+                        model=candidate_model,
+                        messages=[{"role": "user", "content": prompt}],
+                        temperature=0.1,
+                        timeout=deadline_s,
+                        **options,
+                    ),
+                    timeout=deadline_s,
+                )
+            except asyncio.CancelledError:
+                self.router.release(candidate_model)
+                raise
+            except Exception as exc:  # noqa: BLE001
+                reason = classify_failure(exc)
+                if reason is None:
+                    # Bad request, auth and the like: another model would fail the same way.
+                    self.router.release(candidate_model)
+                    raise
+                last_error = exc
+                self.router.record_failure(candidate_model, reason)
+                log_event(
+                    self.logger,
+                    "WARN",
+                    "llm_model_failover",
+                    prompt_type=prompt_type,
+                    model=candidate_model,
+                    reason=reason,
+                    deadline_s=deadline_s,
+                    error=str(exc) or type(exc).__name__,
+                )
+                continue
+            self.router.record_success(candidate_model, prompt_type, time.time() - start)
+            if last_error is not None:
+                log_event(
+                    self.logger,
+                    "WARN",
+                    "llm_model_fallback_used",
+                    prompt_type=prompt_type,
+                    requested_model=candidates[0],
+                    fallback_model=candidate_model,
+                    models=self.router.snapshot(),
+                )
+            return response, candidate_model
+        if last_error is not None:
+            raise last_error
+        raise RuntimeError(f"No Groq model available for {prompt_type}; every model breaker is open.")
+
+    def _client(self) -> AsyncGroq:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            # No SDK-level retries: a retry on the same model would eat the deadline the router fails over on.
+            client = AsyncGroq(api_key=self.api_key, max_retries=0)
+            self._clients[loop] = client
+        return client
+
 
 def _extract_json(text: str) -> str:
     text = text.strip()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Any
+
+import groq
+
+from src.core.endpoint_health import EndpointHealthRegistry
+
+# Seconds one model gets to answer (or, when streaming, to start answering) before failover.
+DEFAULT_DEADLINES_S = {
+    "intent_parser": 4.0,
+    "final_summary": 12.0,
+}
+DEFAULT_DEADLINE_S = 20.0
+# Cheap, latency-sensitive prompt types: any healthy model will do, so the fastest goes first.
+FAST_PROMPT_TYPES = {"intent_parser"}
+
+# Process-wide model health.
+_MODEL_HEALTH = EndpointHealthRegistry(failure_threshold=3, open_duration_s=30.0)
+
+
+class ModelRouter:
+    """Orders Groq models per call and enforces per-prompt-type deadlines."""
+
+    def __init__(
+        self,
+        models: list[str],
+        logger: Any,
+        health: EndpointHealthRegistry | None = None,
+    ) -> None:
+        # Keep the first occurrence: GROQ_MODEL may repeat one of the fallbacks.
+        self.models = list(dict.fromkeys(models))
+        self.logger = logger
+        self.health = health or _MODEL_HEALTH
+        self.deadlines_s = {**DEFAULT_DEADLINES_S, **_parse_deadlines(os.getenv("LLM_DEADLINES_S", ""))}
+
+    def route(self, prompt_type: str) -> list[str]:
+        available = self.health.ordered(self.models, self.logger)
+        if prompt_type in FAST_PROMPT_TYPES:
+            return available
+        allowed = set(available)
+        return [model for model in self.models if model in allowed]
+
+    def deadline_s(self, prompt_type: str) -> float:
+        return self.deadlines_s.get(prompt_type, DEFAULT_DEADLINE_S)
+
+    def try_acquire(self, model: str) -> bool:
+        return self.health.try_acquire(model)
+
+    def record_success(self, model: str, prompt_type: str, latency_s: float) -> None:
+        # Only latency-routed calls feed the latency EWMA: summaries (full generations, or just
+        # stream opening) take a different time per model and would skew intent routing.
+        sample = latency_s if prompt_type in FAST_PROMPT_TYPES else None
+        self.health.record_success(model, sample, self.logger)
+
+    def record_failure(self, model: str, reason: str) -> None:
+        # Rate limits and missing models will not clear within a few calls; open at once.
+        self.health.record_failure(
+            model,
+            reason,
+            self.logger,
+            trip_now=reason in {"rate_limited", "model_not_found"},
+        )
+
+    def release(self, model: str) -> None:
+        self.health.release(model)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        snapshot = self.health.snapshot()
+        return {model: snapshot[model] for model in self.models if model in snapshot}
+
+
+def classify_failure(exc: BaseException) -> str | None:
+    """Failover reason for a failed Groq call, or None when another model would fail the same way."""
+    if isinstance(exc, (asyncio.TimeoutError, groq.APITimeoutError)):
+        return "timeout"
+    if isinstance(exc, groq.APIConnectionError):
+        return "connection_error"
+    if isinstance(exc, groq.RateLimitError):
+        return "rate_limited"
+    if isinstance(exc, groq.NotFoundError):
+        return "model_not_found"
+    if isinstance(exc, groq.APIStatusError) and exc.status_code >= 500:
+        return f"http_{exc.status_code}"
+    return None
+
+
+def _parse_deadlines(raw: str) -> dict[str, float]:
+    deadlines: dict[str, float] = {}
+    for item in raw.split(","):
+        prompt_type, _, seconds = item.partition("=")
+        prompt_type = prompt_type.strip()
+        try:
+            value = float(seconds)
+        except ValueError:
+            continue
+        if prompt_type and value > 0:
+            deadlines[prompt_type] = value
+    return deadlines
@@ -1,16 +1,45 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import os
+import time
 from dataclasses import asdict
-from typing import Any
+from concurrent.futures import Future
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator
 
-from src.agent.intent_parser import IntentParser
+from src.agent.intent_parser import IntentParser, differing_fields
+from src.agent.json_field_stream import JsonStringFieldStream
 from src.agent.planner import build_plan
-from src.agent.prompt_builder import build_final_answer_prompt
-from src.agent.self_correction import maybe_retry_tools, validate_candidates
+from src.agent.prompt_builder import (
+    build_final_answer_prompt,
+    compact_final_answer_data,
+    estimate_tokens,
+    summary_candidate_fields,
+)
+from src.agent.self_correction import maybe_retry_tools, prefilter_seeds, validate_candidates
 from src.agent.slot_policy import missing_slots, next_clarifying_question, should_ask_weather_preference
+from src.core.async_runtime import iterate_sync, run_sync, submit
+from src.core.cache import MemoryCache, PersistentCache, get_persistent_cache
 from src.core.logger import log_event
+from src.core.rate_limiter import RateLimitExceeded
 from src.ranking.scorer import score_candidate, season_from_date_or_month
+from src.tools.seed_catalog import SEED_DESTINATIONS, SeedCatalog
+
+DEFAULT_SUMMARY = "Here are the best options based on your constraints."
+
+SUMMARY_CACHE_TTL_S = 3 * 24 * 3600
+SUMMARY_CACHE_MAX_ENTRIES = 5000
+# Any edit to the summary prompt template or its payload shape changes this, so stale summaries are never served.
+SUMMARY_PROMPT_VERSION = hashlib.sha256(
+    build_final_answer_prompt(
+        {**compact_final_answer_data({}, token_budget=0), "top_candidates": [summary_candidate_fields({})]}
+    ).encode("utf-8")
+).hexdigest()[:12]
+
+# ParsedIntent fields that _build_candidates reads; speculation is reused only if they all match.
+SPECULATION_FIELDS = ("destination", "activity", "travel_date_or_month", "max_flight_hours")
 
 
 class AgentOrchestrator:
@@ -22,6 +51,9 @@ class AgentOrchestrator:
         weather_tool: Any,
         places_tool: Any,
         flight_tool: Any,
+        max_workers: int | None = None,
+        seed_catalog: SeedCatalog | None = None,
+        summary_cache: MemoryCache | PersistentCache | None = None,
     ) -> None:
         self.logger = logger
         self.llm_client = llm_client
@@ -30,10 +62,46 @@ class AgentOrchestrator:
         self.weather_tool = weather_tool
         self.places_tool = places_tool
         self.flight_tool = flight_tool
+        self.seed_catalog = seed_catalog or SeedCatalog()
+        # Cap on concurrent tool calls per turn; 1 keeps the sequential path.
+        if max_workers is None:
+            max_workers = int(os.getenv("TOOL_MAX_WORKERS", "8"))
+        self.max_workers = max(1, max_workers)
+        # Build candidates from the rule-based parse while the intent LLM call is in flight.
+        self.speculative_prefetch = os.getenv("SPECULATIVE_PREFETCH", "true").lower() == "true"
+        self._speculations: set[asyncio.Task[list[dict[str, Any]]]] = set()
+        # "stream" renders the final summary token by token; "blocking" waits for the full answer;
+        # "background" answers with the deterministic text and patches the LLM summary in later.
+        self.summary_mode = os.getenv("SUMMARY_MODE", "stream").lower()
+        self.summary_timeout_s = float(os.getenv("SUMMARY_TIMEOUT_S", "8"))
+        # Upper bound on the (estimated) final-summary prompt size; trims payload detail beyond it.
+        self.summary_token_budget = int(os.getenv("SUMMARY_PROMPT_TOKEN_BUDGET", "600"))
+        # Summaries depend only on the ranked candidates, so every session shares one cache.
+        self.summary_cache = summary_cache or get_persistent_cache(
+            "summary",
+            max_entries=SUMMARY_CACHE_MAX_ENTRIES,
+            default_ttl_s=SUMMARY_CACHE_TTL_S,
+        )
 
     def run(self, user_text: str, memory: Any) -> dict[str, Any]:
+        return run_sync(self.arun(user_text, memory))
+
+    def stream(self, user_text: str, memory: Any) -> Iterator[dict[str, Any]]:
+        """Sync view of :meth:`astream` for the Streamlit script thread."""
+        return iterate_sync(self.astream(user_text, memory))
+
+    async def arun(self, user_text: str, memory: Any) -> dict[str, Any]:
+        result: dict[str, Any] = {}
+        async for event in self.astream(user_text, memory):
+            if event["type"] == "result":
+                result = event["result"]
+        return result
+
+    async def astream(self, user_text: str, memory: Any) -> AsyncIterator[dict[str, Any]]:
+        """Yield ``summary_delta`` events while the summary streams, then one ``result`` event."""
         plan = [asdict(step) for step in build_plan()]
-        parsed = self.intent_parser.parse(user_text)
+        speculation = self._start_speculation(user_text, memory)
+        parsed = await self.intent_parser.aparse(user_text)
         parsed = self._apply_memory_context(parsed, memory)
         effective_weather_pref = self._effective_weather_preference(parsed, memory)
         log_event(self.logger, "INFO", "intent_parsed", parsed=asdict(parsed))
@@ -41,23 +109,31 @@ class AgentOrchestrator:
         missing = missing_slots(parsed)
         if missing:
             question = next_clarifying_question(missing)
-            return {
-                "status": "needs_clarification",
-                "question": question,
-                "missing_slot": missing[0],
-                "plan": plan,
-                "parsed": asdict(parsed),
-            }
+            yield _result_event(
+                {
+                    "status": "needs_clarification",
+                    "question": question,
+                    "missing_slot": missing[0],
+                    "plan": plan,
+                    "parsed": asdict(parsed),
+                }
+            )
+            return
 
         if should_ask_weather_preference(parsed, effective_weather_pref):
-            return {
-                "status": "needs_weather_preference",
-                "question": "Do you prefer cold, mild, warm weather, or no preference?",
-                "plan": plan,
-                "parsed": asdict(parsed),
-            }
+            yield _result_event(
+                {
+                    "status": "needs_weather_preference",
+                    "question": "Do you prefer cold, mild, warm weather, or no preference?",
+                    "plan": plan,
+                    "parsed": asdict(parsed),
+                }
+            )
+            return
 
-        candidates = self._build_candidates(parsed, memory)
+        candidates = await self._take_speculation(speculation, parsed)
+        if candidates is None:
+            candidates = await self._build_candidates(parsed, memory)
         candidates = maybe_retry_tools(candidates, self.logger)
         candidates = validate_candidates(
             candidates,
@@ -67,12 +143,15 @@ class AgentOrchestrator:
         )
 
         if not candidates:
-            return {
-                "status": "no_results",
-                "message": "I could not find fitting destinations. Could you adjust the date or constraints?",
-                "plan": plan,
-                "parsed": asdict(parsed),
-            }
+            yield _result_event(
+                {
+                    "status": "no_results",
+                    "message": "I could not find fitting destinations. Could you adjust the date or constraints?",
+                    "plan": plan,
+                    "parsed": asdict(parsed),
+                }
+            )
+            return
 
         season = season_from_date_or_month(parsed.travel_date_or_month or "")
         scored = [
@@ -95,32 +174,106 @@ class AgentOrchestrator:
             "top_candidates": top,
             "preferred_weather": effective_weather_pref,
         }
-        summary = self._build_summary(llm_payload, top)
-        detailed_message = self._build_detailed_message(summary, top)
+        summary_future: Future[str | None] | None = None
+        if self.summary_mode == "background":
+            # Answer now with the deterministic text; the LLM summary follows off the critical path.
+            detailed_message = self._build_detailed_message(self._template_summary(top), top)
+            summary_future = submit(self._background_summary(llm_payload, top))
+        else:
+            summary_parts: list[str] = []
+            async for delta in self._stream_summary(llm_payload, top):
+                summary_parts.append(delta)
+                yield {"type": "summary_delta", "text": delta}
+            detailed_message = self._build_detailed_message("".join(summary_parts), top)
         feedback_prompt = "What do you think about these options?"
         if len(top) == 1:
             feedback_prompt = "What do you think about this option?"
         memory.update_from_parsed(parsed)
 
-        return {
-            "status": "ok",
-            "summary": detailed_message,
-            "recommendations": top,
-            "plan": plan,
-            "parsed": asdict(parsed),
-            "feedback_prompt": (
-                f"{feedback_prompt} "
-                "Reply with: 'like 1' or 'not good, new options'."
-            ),
-        }
+        yield _result_event(
+            {
+                "status": "ok",
+                "summary": detailed_message,
+                "recommendations": top,
+                "plan": plan,
+                "parsed": asdict(parsed),
+                "feedback_prompt": (
+                    f"{feedback_prompt} "
+                    "Reply with: 'like 1' or 'not good, new options'."
+                ),
+                # Background mode only: resolves to the patched message, or None to keep "summary".
+                "summary_future": summary_future,
+            }
+        )
+
+    def _start_speculation(
+        self,
+        user_text: str,
+        memory: Any,
+    ) -> tuple[Any, asyncio.Task[list[dict[str, Any]]]] | None:
+        if not self.speculative_prefetch:
+            return None
+        rules = self.intent_parser.parse_rules(user_text)
+        # Free-text destinations ("to paris in december" -> "Paris In") rarely survive the final
+        # parse, and a speculative geocode spends the shared Nominatim token the real one then waits for.
+        if rules.destination and (
+            self.intent_parser.slot_confidence(user_text, "destination") < self.intent_parser.bypass_threshold
+        ):
+            log_event(self.logger, "DEBUG", "speculation_skipped", reason="low_confidence_destination")
+            return None
+        guess = self._apply_memory_context(rules, memory)
+        # Only speculate when the rule parse would itself reach candidate building.
+        if missing_slots(guess) or should_ask_weather_preference(
+            guess, self._effective_weather_preference(guess, memory)
+        ):
+            return None
+        log_event(
+            self.logger,
+            "DEBUG",
+            "speculation_started",
+            guess={field: getattr(guess, field) for field in SPECULATION_FIELDS},
+        )
+        task = asyncio.create_task(self._build_candidates(guess, memory))
+        # Discarded speculations finish in the background; they still warm the tool caches.
+        self._speculations.add(task)
+        task.add_done_callback(self._speculation_done)
+        return guess, task
+
+    async def _take_speculation(
+        self,
+        speculation: tuple[Any, asyncio.Task[list[dict[str, Any]]]] | None,
+        parsed: Any,
+    ) -> list[dict[str, Any]] | None:
+        # Returns the speculative candidates when the final parse agrees, else None.
+        if speculation is None:
+            return None
+        guess, task = speculation
+        mismatched = differing_fields(guess, parsed, SPECULATION_FIELDS)
+        if mismatched:
+            log_event(self.logger, "INFO", "speculation_discarded", fields=mismatched)
+            return None
+        was_done = task.done()
+        try:
+            candidates = await task
+        except Exception as exc:  # noqa: BLE001
+            log_event(self.logger, "WARN", "speculation_failed", error=str(exc))
+            return None
+        log_event(self.logger, "INFO", "speculation_used", finished_before_parse=was_done)
+        return candidates
 
-    def _build_candidates(self, parsed: Any, memory: Any) -> list[dict[str, Any]]:
+    def _speculation_done(self, task: asyncio.Task[list[dict[str, Any]]]) -> None:
+        self._speculations.discard(task)
+        if not task.cancelled():
+            # Mark the exception as retrieved; _take_speculation logs it when it matters.
+            task.exception()
+
+    async def _build_candidates(self, parsed: Any, memory: Any) -> list[dict[str, Any]]:
         if parsed.destination:
-            seeds = self.geocoding_tool.geocode(parsed.destination, limit=2)
+            seeds = await self.geocoding_tool.ageocode(parsed.destination, limit=2)
         elif parsed.activity and parsed.activity.lower() == "skiing":
-            seeds = self._geocode_seed_locations(["Innsbruck", "Aspen", "Chamonix", "Sapporo", "Queenstown"])
+            seeds = await self._catalog_seeds("skiing")
         else:
-            seeds = self._geocode_seed_locations(["Lisbon", "Bangkok", "Tokyo", "Cape Town", "Vancouver", "Buenos Aires"])
+            seeds = await self._catalog_seeds("discovery")
         if not seeds:
             log_event(
                 self.logger,
@@ -131,61 +284,253 @@ class AgentOrchestrator:
             )
             return []
 
-        candidates: list[dict[str, Any]] = []
-        for seed in seeds:
-            weather = self.weather_tool.fetch_weather_score(
-                lat=seed["lat"],
-                lon=seed["lon"],
-                travel_date_or_month=parsed.travel_date_or_month,
-            )
-            places = self.places_tool.fetch_activity_signals(
-                lat=seed["lat"],
-                lon=seed["lon"],
-                activity=parsed.activity,
-            )
-            flight_hours = self.flight_tool.estimate_hours(
-                origin_city=memory.origin_city or "",
-                origin_country=memory.origin_country or "",
-                destination_lat=seed["lat"],
-                destination_lon=seed["lon"],
+        if parsed.destination:
+            # Only the top geocode match becomes a candidate.
+            seeds = seeds[:1]
+
+        # Origin is resolved once per turn; all seed distances come from one vectorized call.
+        origin_airport = self.flight_tool.resolve_origin(
+            memory.origin_city or "",
+            memory.origin_country or "",
+            memory.origin_lat,
+            memory.origin_lon,
+        )
+        flight_hours_rows = self.flight_tool.estimate_hours_many(
+            origin_airport,
+            [seed["lat"] for seed in seeds],
+            [seed["lon"] for seed in seeds],
+        )
+        stubs = [
+            {
+                "destination": seed["name"].split(",")[0],
+                "lat": seed["lat"],
+                "lon": seed["lon"],
+                "activity": parsed.activity,
+                "preferred_weather": self._effective_weather_preference(parsed, memory),
+                "estimated_flight_hours": flight_hours,
+            }
+            for seed, flight_hours in zip(seeds, flight_hours_rows)
+        ]
+        # Local constraints first: weather/POI calls only run for seeds that can still be shown.
+        survivors = prefilter_seeds(stubs, parsed.max_flight_hours, memory.rejected_destinations, self.logger)
+        batched = not parsed.destination
+        planned_calls = self._enrichment_calls(stubs, parsed, batched)
+        calls = self._enrichment_calls(survivors, parsed, batched)
+        log_event(
+            self.logger,
+            "INFO",
+            "seed_prefilter_applied",
+            seeds=len(stubs),
+            survivors=len(survivors),
+            tool_calls_saved=len(planned_calls) - len(calls),
+            # Batched calls stay at one request each, but carry fewer points.
+            points_saved=(len(stubs) - len(survivors)) if batched else 0,
+        )
+        if not survivors:
+            return []
+
+        results = await self._run_tool_calls(calls)
+        weather_rows = results[0] if batched else results[: len(survivors)]
+        places_rows = results[1] if batched else results[len(survivors) :]
+        return [
+            {**stub, **weather, **places}
+            for stub, weather, places in zip(survivors, weather_rows, places_rows)
+        ]
+
+    def _enrichment_calls(
+        self,
+        stubs: list[dict[str, Any]],
+        parsed: Any,
+        batched: bool,
+    ) -> list[tuple[Callable[..., Awaitable[Any]], dict[str, Any]]]:
+        # Weather calls first, then places calls, so results split at len(stubs) (or 1 when batched).
+        if not stubs:
+            return []
+        if batched:
+            # Discovery turns fetch weather and POIs for every seed in one batched request each.
+            points = [(stub["lat"], stub["lon"]) for stub in stubs]
+            return [
+                (
+                    self.weather_tool.afetch_weather_scores_batch,
+                    {"points": points, "travel_date_or_month": parsed.travel_date_or_month},
+                ),
+                (
+                    self.places_tool.afetch_activity_signals_batch,
+                    {"points": points, "activity": parsed.activity},
+                ),
+            ]
+        calls: list[tuple[Callable[..., Awaitable[Any]], dict[str, Any]]] = []
+        for stub in stubs:
+            calls.append(
+                (
+                    self.weather_tool.afetch_weather_score,
+                    {
+                        "lat": stub["lat"],
+                        "lon": stub["lon"],
+                        "travel_date_or_month": parsed.travel_date_or_month,
+                    },
+                )
             )
-            candidates.append(
-                {
-                    "destination": seed["name"].split(",")[0],
-                    "lat": seed["lat"],
-                    "lon": seed["lon"],
-                    "activity": parsed.activity,
-                    "preferred_weather": self._effective_weather_preference(parsed, memory),
-                    "estimated_flight_hours": flight_hours,
-                    **weather,
-                    **places,
-                }
+        for stub in stubs:
+            calls.append(
+                (
+                    self.places_tool.afetch_activity_signals,
+                    {"lat": stub["lat"], "lon": stub["lon"], "activity": parsed.activity},
+                )
             )
-        if parsed.destination and candidates:
-            return candidates[:1]
-        return candidates
+        return calls
+
+    async def _run_tool_calls(
+        self,
+        calls: list[tuple[Callable[..., Awaitable[Any]], dict[str, Any]]],
+    ) -> list[Any]:
+        # Results keep call order so candidates are assembled in seed order.
+        start = time.time()
+        latencies_ms = [0] * len(calls)
+        workers = min(self.max_workers, len(calls))
+        semaphore = asyncio.Semaphore(max(1, workers))
+
+        async def timed(index: int, func: Callable[..., Awaitable[Any]], kwargs: dict[str, Any]) -> Any:
+            async with semaphore:
+                call_start = time.time()
+                try:
+                    return await func(**kwargs)
+                finally:
+                    latencies_ms[index] = int((time.time() - call_start) * 1000)
+
+        # Tasks inherit the turn's context, so correlation ids need no extra plumbing.
+        results = await asyncio.gather(
+            *(timed(index, func, kwargs) for index, (func, kwargs) in enumerate(calls))
+        )
 
-    def _geocode_seed_locations(self, names: list[str]) -> list[dict[str, Any]]:
+        wall_ms = int((time.time() - start) * 1000)
+        sequential_ms = sum(latencies_ms)
+        log_event(
+            self.logger,
+            "INFO",
+            "tool_fanout_completed",
+            mode="concurrent" if workers > 1 else "sequential",
+            workers=workers,
+            calls=len(calls),
+            wall_ms=wall_ms,
+            sequential_ms=sequential_ms,
+            saved_ms=max(0, sequential_ms - wall_ms),
+        )
+        return list(results)
+
+    async def _catalog_seeds(self, tag: str) -> list[dict[str, Any]]:
+        seeds = self.seed_catalog.seeds_for_tag(tag)
+        if seeds:
+            return seeds
+        # Catalog missing or stale: resolve the same seed names live.
+        log_event(self.logger, "WARN", "seed_catalog_miss", tag=tag)
+        return await self._geocode_seed_locations(
+            [seed["query"] for seed in SEED_DESTINATIONS if tag in seed["tags"]]
+        )
+
+    async def _geocode_seed_locations(self, names: list[str]) -> list[dict[str, Any]]:
         output = []
-        for name in names:
-            rows = self.geocoding_tool.geocode(name, limit=1)
+        for index, name in enumerate(names):
+            try:
+                rows = await self.geocoding_tool.ageocode(name, limit=1)
+            except RateLimitExceeded:
+                # Geocoder is saturated; the remaining seeds would only queue behind this one.
+                log_event(self.logger, "WARN", "seed_geocode_skipped", skipped=names[index:])
+                break
             if rows:
                 output.append(rows[0])
         return output
 
-    def _build_summary(self, payload: dict[str, Any], top: list[dict[str, Any]]) -> str:
-        prompt = build_final_answer_prompt(payload)
+    async def _stream_summary(self, payload: dict[str, Any], top: list[dict[str, Any]]) -> AsyncIterator[str]:
+        # Yields summary text as it arrives; always yields something, falling back to a template.
+        cache_key = summary_fingerprint(payload)
+        cached = self.summary_cache.get(cache_key)
+        if cached is not None:
+            log_event(self.logger, "INFO", "summary_cache_hit", stats=self.summary_cache.stats())
+            yield cached
+            return
+        log_event(self.logger, "DEBUG", "summary_cache_miss", stats=self.summary_cache.stats())
+        prompt = self._final_answer_prompt(payload)
+        extractor = JsonStringFieldStream("summary")
+        start = time.time()
         try:
-            text = self.llm_client.generate_json(prompt, "final_summary")
-            data = json.loads(text)
-            return data.get("summary", "Here are the best options based on your constraints.")
+            if self.summary_mode != "stream":
+                text = await self.llm_client.agenerate_json(prompt, "final_summary")
+                summary = json.loads(text).get("summary")
+                if summary:
+                    self.summary_cache.set(cache_key, summary, ttl_s=SUMMARY_CACHE_TTL_S)
+                yield summary or DEFAULT_SUMMARY
+                return
+            first_token_s: float | None = None
+            async for chunk in self.llm_client.astream_json(prompt, "final_summary"):
+                delta = extractor.feed(chunk)
+                if not delta:
+                    continue
+                if first_token_s is None:
+                    first_token_s = time.time() - start
+                yield delta
+            log_event(
+                self.logger,
+                "INFO",
+                "summary_streamed",
+                ttft_ms=int(first_token_s * 1000) if first_token_s is not None else None,
+                latency_ms=int((time.time() - start) * 1000),
+                chars=len(extractor.value),
+            )
+            if extractor.value and extractor.done:
+                self.summary_cache.set(cache_key, extractor.value, ttl_s=SUMMARY_CACHE_TTL_S)
+            if not extractor.value:
+                yield DEFAULT_SUMMARY
         except Exception as exc:  # noqa: BLE001
-            log_event(self.logger, "WARN", "summary_llm_failed", error=str(exc))
-            first = top[0]
-            return (
-                f"Best current match is {first['destination']} with score {round(first['score'], 1)}. "
-                "I also included alternatives with clear tradeoffs."
+            log_event(self.logger, "WARN", "summary_llm_failed", error=str(exc), streamed_chars=len(extractor.value))
+            if extractor.value:
+                # Part of the summary is already on screen; keep it rather than swapping text.
+                return
+            yield self._template_summary(top)
+
+    def _final_answer_prompt(self, payload: dict[str, Any]) -> str:
+        prompt = build_final_answer_prompt(compact_final_answer_data(payload, self.summary_token_budget))
+        log_event(
+            self.logger,
+            "INFO",
+            "summary_prompt_compacted",
+            prompt_est_before=estimate_tokens(build_final_answer_prompt(payload, indent=2)),
+            prompt_est_after=estimate_tokens(prompt),
+            prompt_budget=self.summary_token_budget,
+        )
+        return prompt
+
+    async def _background_summary(self, payload: dict[str, Any], top: list[dict[str, Any]]) -> str | None:
+        # Full LLM message for the chat patch, or None when the deterministic text should stay.
+        start = time.time()
+
+        async def collect() -> str:
+            return "".join([delta async for delta in self._stream_summary(payload, top)])
+
+        try:
+            summary = await asyncio.wait_for(collect(), timeout=self.summary_timeout_s)
+        except asyncio.TimeoutError:
+            log_event(
+                self.logger,
+                "WARN",
+                "summary_background_timeout",
+                timeout_s=self.summary_timeout_s,
             )
+            return None
+        log_event(
+            self.logger,
+            "INFO",
+            "summary_background_ready",
+            latency_ms=int((time.time() - start) * 1000),
+        )
+        return self._build_detailed_message(summary, top)
+
+    def _template_summary(self, top: list[dict[str, Any]]) -> str:
+        first = top[0]
+        return (
+            f"Best current match is {first['destination']} with score {round(first['score'], 1)}. "
+            "I also included alternatives with clear tradeoffs."
+        )
 
     def _build_detailed_message(self, summary: str, recommendations: list[dict[str, Any]]) -> str:
         normalized_summary = self._normalize_summary_for_count(summary, len(recommendations))
@@ -258,3 +603,24 @@ class AgentOrchestrator:
         if activity.startswith("weather_preference:mild"):
             return "mild"
         return memory.preferred_weather
+
+
+def summary_fingerprint(payload: dict[str, Any]) -> str:
+    """Cache key for a final-summary payload: only the fields the summary talks about."""
+    candidates = payload.get("top_candidates", [])
+    canonical = json.dumps(
+        {
+            "intent": payload.get("intent"),
+            "preferred_weather": payload.get("preferred_weather"),
+            "activity": candidates[0].get("activity") if candidates else None,
+            "top_candidates": [summary_candidate_fields(candidate) for candidate in candidates],
+        },
+        sort_keys=True,
+        default=str,
+    )
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:24]
+    return f"{SUMMARY_PROMPT_VERSION}|{digest}"
+
+
+def _result_event(result: dict[str, Any]) -> dict[str, Any]:
+    return {"type": "result", "result": result}
@@ -3,6 +3,11 @@ from __future__ import annotations
 import json
 from typing import Any
 
+# Rough Llama-family ratio for English text and JSON; good enough to keep prompts under a budget.
+CHARS_PER_TOKEN = 4
+MAX_SAMPLE_NAMES = 3
+MAX_NAME_CHARS = 40
+
 
 def build_intent_prompt(user_text: str) -> str:
     payload = {
@@ -51,11 +56,13 @@ def build_activity_prompt(data: dict[str, Any]) -> str:
     )
 
 
-def build_final_answer_prompt(data: dict[str, Any]) -> str:
+def build_final_answer_prompt(data: dict[str, Any], indent: int | None = None) -> str:
+    # Compact JSON by default; pass indent=2 to render the legacy (uncompacted) layout.
+    separators = None if indent else (",", ":")
     return (
         "ROLE:\n"
         "You are a travel recommendation assistant.\n\n"
-        f"DATA:\n{json.dumps(data, indent=2, default=str)}\n\n"
+        f"DATA:\n{json.dumps(data, indent=indent, separators=separators, default=str)}\n\n"
         "TASK:\n"
         "Write a concise explanation of top recommendations and tradeoffs.\n\n"
         "RESPONSE_FORMAT (JSON ONLY):\n"
@@ -70,3 +77,48 @@ def build_final_answer_prompt(data: dict[str, Any]) -> str:
         "  ]\n"
         "}"
     )
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def summary_candidate_fields(candidate: dict[str, Any]) -> dict[str, Any]:
+    """The part of a scored candidate the final summary talks about, rounded for the prompt."""
+    flight_hours = candidate.get("estimated_flight_hours")
+    return {
+        "destination": candidate.get("destination"),
+        "score": round(float(candidate.get("score", 0.0))),
+        "flight_hours": round(float(flight_hours), 1) if flight_hours is not None else None,
+        "max_temp": round(float(candidate.get("max_temp", 24.0))),
+        "min_temp": round(float(candidate.get("min_temp", 14.0))),
+        "rain": round(float(candidate.get("rain", 0.0)), 1),
+        "poi_count": candidate.get("poi_count", 0),
+        "sample_names": [
+            str(name)[:MAX_NAME_CHARS] for name in candidate.get("sample_names", [])[:MAX_SAMPLE_NAMES]
+        ],
+    }
+
+
+def compact_final_answer_data(data: dict[str, Any], token_budget: int) -> dict[str, Any]:
+    """Project the final-summary payload to what the summary needs and fit it into ``token_budget``."""
+    # No user wording: cached summaries are shared across users with the same fingerprint.
+    candidates = data.get("top_candidates", [])
+    compacted = {
+        "intent": data.get("intent"),
+        "activity": candidates[0].get("activity") if candidates else None,
+        "preferred_weather": data.get("preferred_weather"),
+        "top_candidates": [summary_candidate_fields(candidate) for candidate in candidates],
+    }
+
+    def fits() -> bool:
+        return estimate_tokens(build_final_answer_prompt(compacted)) <= token_budget
+
+    for keep in range(MAX_SAMPLE_NAMES - 1, -1, -1):
+        if fits():
+            return compacted
+        for candidate in compacted["top_candidates"]:
+            candidate["sample_names"] = candidate["sample_names"][:keep]
+    while not fits() and len(compacted["top_candidates"]) > 1:
+        compacted["top_candidates"].pop()
+    return compacted
@@ -33,6 +33,17 @@ def validate_candidates(
     return filtered
 
 
+def prefilter_seeds(
+    seeds: list[dict[str, Any]],
+    max_flight_hours: float | None,
+    rejected_destinations: set[str],
+    logger: Any,
+) -> list[dict[str, Any]]:
+    # Same rules as validate_candidates, applied to seed stubs (name, coordinates,
+    # flight estimate) before any network enrichment is spent on them.
+    return validate_candidates(seeds, max_flight_hours, rejected_destinations, logger)
+
+
 def maybe_retry_tools(
     data: Any,
     logger: Any,
@@ -8,6 +8,8 @@ from typing import Any
 class SessionMemory:
     origin_city: str | None = None
     origin_country: str | None = None
+    origin_lat: float | None = None
+    origin_lon: float | None = None
     preferred_weather: str | None = None
     rejected_destinations: set[str] = field(default_factory=set)
     liked_profiles: list[dict[str, Any]] = field(default_factory=list)
@@ -16,9 +18,12 @@ class SessionMemory:
     last_activity: str | None = None
     last_max_flight_hours: float | None = None
 
-    def set_origin(self, city: str, country: str) -> None:
+    def set_origin(self, city: str, country: str, lat: float | None = None, lon: float | None = None) -> None:
         self.origin_city = city.strip()
         self.origin_country = country.strip()
+        # Geocoded coordinates let flight estimates use the nearest airport to any origin.
+        self.origin_lat = lat
+        self.origin_lon = lon
 
     def add_rejections(self, destinations: list[str]) -> None:
         for destination in destinations:
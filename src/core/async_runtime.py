@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextvars
+import queue
+import threading
+from typing import Any, AsyncIterator, Coroutine, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_LOOP: asyncio.AbstractEventLoop | None = None
+_LOOP_LOCK = threading.Lock()
+
+
+def get_runtime_loop() -> asyncio.AbstractEventLoop:
+    """Process-wide event loop running on a daemon thread; backs every sync wrapper."""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="async-runtime", daemon=True)
+            thread.start()
+            _LOOP = loop
+        return _LOOP
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` on the shared runtime loop and block until it finishes."""
+    # Blocking inside a running loop would stall it; async callers await directly.
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError("run_sync() called from a running event loop; await the async API instead.")
+    context = contextvars.copy_context()
+    future = asyncio.run_coroutine_threadsafe(_in_context(coro, context), get_runtime_loop())
+    return future.result()
+
+
+def submit(coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+    """Schedule ``coro`` on the runtime loop without waiting."""
+    context = contextvars.copy_context()
+    return asyncio.run_coroutine_threadsafe(_in_context(coro, context), get_runtime_loop())
+
+
+def iterate_sync(items: AsyncIterator[T]) -> Iterator[T]:
+    """Drive an async iterator on the runtime loop, yielding each item to the calling thread."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError("iterate_sync() called from a running event loop; iterate the async API instead.")
+    handoff: queue.Queue[tuple[bool, Any]] = queue.Queue()
+
+    async def pump() -> None:
+        try:
+            async for item in items:
+                handoff.put((False, item))
+        except BaseException as exc:  # noqa: BLE001
+            handoff.put((True, exc))
+            raise
+        handoff.put((True, None))
+
+    context = contextvars.copy_context()
+    future = asyncio.run_coroutine_threadsafe(_in_context(pump(), context), get_runtime_loop())
+    try:
+        while True:
+            finished, value = handoff.get()
+            if finished:
+                if value is not None:
+                    raise value
+                return
+            yield value
+    finally:
+        future.cancel()
+
+
+async def _in_context(coro: Coroutine[Any, Any, T], context: contextvars.Context) -> T:
+    # The task runs in a copy of the loop thread's context; seed it with the caller's values.
+    for var, value in context.items():
+        var.set(value)
+    return await coro
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[2] / ".cache"
+
+_SHARED_CACHES: dict[str, "PersistentCache"] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+class PersistentCache:
+    """SQLite-backed JSON cache with TTL and LRU eviction, mirrored in memory."""
+
+    def __init__(self, path: str | Path, namespace: str, max_entries: int, default_ttl_s: float) -> None:
+        self.path = Path(path)
+        self.table = "cache_" + "".join(ch if ch.isalnum() else "_" for ch in namespace)
+        self.max_entries = max_entries
+        self.default_ttl_s = default_ttl_s
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # key -> (expires_at, JSON text), least recently used first.
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._writes: queue.Queue[tuple[str, tuple[Any, ...]]] = queue.Queue()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=5)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.table}_lru ON {self.table} (last_access)"
+            )
+            self._conn.execute(f"DELETE FROM {self.table} WHERE expires_at < ?", (time.time(),))
+            rows = self._conn.execute(
+                f"SELECT key, value, expires_at FROM {self.table} ORDER BY last_access DESC LIMIT ?",
+                (max_entries,),
+            ).fetchall()
+        for key, value, expires_at in reversed(rows):
+            self._entries[key] = (expires_at, value)
+        threading.Thread(target=self._write_loop, name=f"cache-writer-{namespace}", daemon=True).start()
+        atexit.register(self.flush)
+
+    def get(self, key: str) -> Any | None:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < now:
+                if entry is not None:
+                    del self._entries[key]
+                    self._writes.put(("delete", (key,)))
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        self._writes.put(("touch", (now, key)))
+        # Decode per call so callers may mutate what they get back.
+        return json.loads(entry[1])
+
+    def set(self, key: str, value: Any, ttl_s: float | None = None) -> None:
+        now = time.time()
+        expires_at = now + (self.default_ttl_s if ttl_s is None else ttl_s)
+        text = json.dumps(value, default=str)
+        with self._lock:
+            self._entries[key] = (expires_at, text)
+            self._entries.move_to_end(key)
+            self._writes.put(("set", (key, text, expires_at, now)))
+            # Least recently read/written entries go first.
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._writes.put(("delete", (evicted,)))
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._writes.put(("delete", (key,)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._writes.put(("clear", ()))
+
+    def flush(self) -> None:
+        """Block until every queued write has reached SQLite."""
+        self._writes.join()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            size = len(self._entries)
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "evictions": self.evictions,
+            "size": size,
+            "max_entries": self.max_entries,
+        }
+
+    def _write_loop(self) -> None:
+        while True:
+            batch = [self._writes.get()]
+            # Apply whatever else is queued in the same transaction.
+            while len(batch) < 500:
+                try:
+                    batch.append(self._writes.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                with self._conn:
+                    for op, args in batch:
+                        self._conn.execute(self._statement(op), args)
+            except sqlite3.Error:
+                pass  # The in-memory copy stays authoritative; the disk copy is best effort.
+            finally:
+                for _ in batch:
+                    self._writes.task_done()
+
+    def _statement(self, op: str) -> str:
+        return {
+            "set": f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at, last_access) VALUES (?, ?, ?, ?)",
+            "touch": f"UPDATE {self.table} SET last_access = ? WHERE key = ?",
+            "delete": f"DELETE FROM {self.table} WHERE key = ?",
+            "clear": f"DELETE FROM {self.table}",
+        }[op]
+
+
+def get_persistent_cache(namespace: str, max_entries: int, default_ttl_s: float) -> PersistentCache:
+    """Return the process-wide cache for ``namespace``, creating it on first use."""
+    with _SHARED_LOCK:
+        cache = _SHARED_CACHES.get(namespace)
+        if cache is None:
+            cache_dir = Path(os.getenv("CACHE_DIR", str(DEFAULT_CACHE_DIR)))
+            cache = PersistentCache(cache_dir / "cache.sqlite3", namespace, max_entries, default_ttl_s)
+            _SHARED_CACHES[namespace] = cache
+        return cache
+
+
+class MemoryCache:
+    """Thread-safe in-process LRU cache with per-entry TTL and an entry cap."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl_s: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.time() + ttl_s, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            size = len(self._entries)
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "evictions": self.evictions,
+            "size": size,
+            "max_entries": self.max_entries,
+        }
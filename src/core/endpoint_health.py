@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from src.core.logger import log_event
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass
+class EndpointState:
+    url: str
+    state: str = CLOSED
+    ewma_latency_s: float | None = None
+    error_rate: float = 0.0
+    consecutive_failures: int = 0
+    opened_until: float = 0.0
+    probe_in_flight: bool = False
+
+    def score(self) -> float:
+        # Lower is better: expected latency inflated by recent unreliability.
+        latency = self.ewma_latency_s if self.ewma_latency_s is not None else 2.0
+        return latency * (1.0 + 4.0 * self.error_rate)
+
+
+class EndpointHealthRegistry:
+    """Per-endpoint circuit breakers plus latency/error EWMAs."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        open_duration_s: float = 60.0,
+        alpha: float = 0.3,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.open_duration_s = open_duration_s
+        self.alpha = alpha
+        self._endpoints: dict[str, EndpointState] = {}
+        self._lock = threading.Lock()
+
+    def ordered(self, urls: list[str], logger: Any) -> list[str]:
+        """Endpoints that may be tried now, healthiest first; half-open probes go last."""
+        now = time.time()
+        closed: list[EndpointState] = []
+        probes: list[EndpointState] = []
+        with self._lock:
+            for url in urls:
+                endpoint = self._get(url)
+                if endpoint.state == OPEN and now >= endpoint.opened_until:
+                    self._transition(endpoint, HALF_OPEN, "cooldown_elapsed", logger)
+                if endpoint.state == CLOSED:
+                    closed.append(endpoint)
+                elif endpoint.state == HALF_OPEN and not endpoint.probe_in_flight:
+                    probes.append(endpoint)
+        closed.sort(key=lambda endpoint: endpoint.score())
+        return [endpoint.url for endpoint in closed + probes]
+
+    def try_acquire(self, url: str) -> bool:
+        # Closed endpoints always pass; a half-open one admits exactly one probe.
+        with self._lock:
+            endpoint = self._get(url)
+            if endpoint.state == CLOSED:
+                return True
+            if endpoint.state == HALF_OPEN and not endpoint.probe_in_flight:
+                endpoint.probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self, url: str, latency_s: float | None, logger: Any) -> None:
+        # latency_s=None records the success without a latency sample (e.g. a non-comparable call).
+        with self._lock:
+            endpoint = self._get(url)
+            if latency_s is not None:
+                endpoint.ewma_latency_s = self._ewma(endpoint.ewma_latency_s, latency_s)
+            endpoint.error_rate = self._ewma(endpoint.error_rate, 0.0)
+            endpoint.consecutive_failures = 0
+            endpoint.probe_in_flight = False
+            if endpoint.state != CLOSED:
+                self._transition(endpoint, CLOSED, "probe_succeeded", logger)
+
+    def record_failure(self, url: str, reason: str, logger: Any, trip_now: bool = False) -> None:
+        with self._lock:
+            endpoint = self._get(url)
+            endpoint.error_rate = self._ewma(endpoint.error_rate, 1.0)
+            endpoint.consecutive_failures += 1
+            was_probe = endpoint.probe_in_flight
+            endpoint.probe_in_flight = False
+            should_open = (
+                trip_now
+                or was_probe
+                or endpoint.state == HALF_OPEN
+                or endpoint.consecutive_failures >= self.failure_threshold
+            )
+            if should_open:
+                endpoint.opened_until = time.time() + self.open_duration_s
+                if endpoint.state != OPEN:
+                    self._transition(endpoint, OPEN, reason, logger)
+
+    def release(self, url: str) -> None:
+        # An attempt that ended without a verdict (e.g. a cancelled hedge) frees its probe slot.
+        with self._lock:
+            self._get(url).probe_in_flight = False
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {
+                url: {
+                    "state": endpoint.state,
+                    "ewma_latency_ms": (
+                        int(endpoint.ewma_latency_s * 1000) if endpoint.ewma_latency_s is not None else None
+                    ),
+                    "error_rate": round(endpoint.error_rate, 3),
+                    "opened_until": endpoint.opened_until,
+                }
+                for url, endpoint in self._endpoints.items()
+            }
+
+    def next_retry_at(self, urls: list[str]) -> float:
+        with self._lock:
+            return min((self._get(url).opened_until for url in urls), default=0.0)
+
+    def _get(self, url: str) -> EndpointState:
+        endpoint = self._endpoints.get(url)
+        if endpoint is None:
+            endpoint = EndpointState(url=url)
+            self._endpoints[url] = endpoint
+        return endpoint
+
+    def _ewma(self, current: float | None, sample: float) -> float:
+        if current is None:
+            return sample
+        return self.alpha * sample + (1 - self.alpha) * current
+
+    def _transition(self, endpoint: EndpointState, new_state: str, reason: str, logger: Any) -> None:
+        previous = endpoint.state
+        endpoint.state = new_state
+        log_event(
+            logger,
+            "WARN" if new_state == OPEN else "INFO",
+            "circuit_breaker_transition",
+            endpoint=endpoint.url,
+            from_state=previous,
+            to_state=new_state,
+            reason=reason,
+            consecutive_failures=endpoint.consecutive_failures,
+            error_rate=round(endpoint.error_rate, 3),
+            ewma_latency_ms=(
+                int(endpoint.ewma_latency_s * 1000) if endpoint.ewma_latency_s is not None else None
+            ),
+        )
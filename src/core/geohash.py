@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def encode(lat: float, lon: float, precision: int) -> str:
+    """Standard base32 geohash of a coordinate."""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        target, value = (lon_range, lon) if even else (lat_range, lat)
+        mid = (target[0] + target[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            target[0] = mid
+        else:
+            bits <<= 1
+            target[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
+
+
+def cell_size(precision: int) -> tuple[float, float]:
+    """(lat_degrees, lon_degrees) covered by one cell at ``precision``."""
+    total_bits = precision * 5
+    lon_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (2**lat_bits), 360.0 / (2**lon_bits)
+
+
+def neighbors(lat: float, lon: float, precision: int) -> list[str]:
+    """The cells around the one containing (lat, lon), excluding that cell."""
+    own = encode(lat, lon, precision)
+    lat_step, lon_step = cell_size(precision)
+    cells = []
+    for dlat in (-1, 0, 1):
+        for dlon in (-1, 0, 1):
+            if dlat == 0 and dlon == 0:
+                continue
+            n_lat = max(-89.999999, min(89.999999, lat + dlat * lat_step))
+            n_lon = ((lon + dlon * lon_step + 180.0) % 360.0) - 180.0
+            cell = encode(n_lat, n_lon, precision)
+            if cell != own and cell not in cells:
+                cells.append(cell)
+    return cells
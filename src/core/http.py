@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import weakref
+from typing import Any
+from urllib.parse import urlparse
+
+import httpx
+
+# httpx clients are bound to the event loop that created them, so keep one per loop.
+_CLIENTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = weakref.WeakKeyDictionary()
+_CLIENTS_LOCK = threading.Lock()
+
+DEFAULT_POOL_MAXSIZE = 10
+MAX_CONNECTIONS = 100
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Keep-alive client shared by all network tools running on the current event loop."""
+    loop = asyncio.get_running_loop()
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(loop)
+        if client is None or client.is_closed:
+            client = _build_client()
+            _CLIENTS[loop] = client
+        return client
+
+
+class ConnectionTrace:
+    """httpcore trace hook counting new TCP connections for one request; 0 means reuse."""
+
+    def __init__(self) -> None:
+        self.new_connections = 0
+
+    async def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self.new_connections += 1
+
+    def extensions(self) -> dict[str, Any]:
+        return {"trace": self}
+
+
+def _build_client() -> httpx.AsyncClient:
+    default_size = int(os.getenv("HTTP_POOL_MAXSIZE", str(DEFAULT_POOL_MAXSIZE)))
+    mounts = {
+        # A host-specific transport has its own pool, sized independently of the default one.
+        f"https://{host}": httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=size, max_keepalive_connections=size, keepalive_expiry=60)
+        )
+        for host, size in _parse_pool_sizes(os.getenv("HTTP_POOL_SIZES", "")).items()
+    }
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=default_size,
+            keepalive_expiry=60,
+        ),
+        mounts=mounts,
+    )
+
+
+def _parse_pool_sizes(raw: str) -> dict[str, int]:
+    sizes: dict[str, int] = {}
+    for item in raw.split(","):
+        host, _, size = item.partition("=")
+        host = host.strip()
+        if not host or not size.strip().isdigit():
+            continue
+        # Accept full URLs as well as bare host names.
+        sizes[urlparse(host).netloc or host] = int(size)
+    return sizes
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import math
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+EARTH_RADIUS_KM = 6371.0
+
+# Node layout: (point index, split axis, left subtree, right subtree).
+_Node = tuple[int, int, "_Node | None", "_Node | None"]
+
+
+class SphereKDTree(Generic[T]):
+    """Static 3-d tree over lat/lon points mapped onto the unit sphere."""
+
+    def __init__(self, items: list[T], coords: list[tuple[float, float]]) -> None:
+        self._items = items
+        self._points = [_to_unit_vector(lat, lon) for lat, lon in coords]
+        self._root = self._build(list(range(len(items))), depth=0)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def nearest(self, lat: float, lon: float) -> tuple[T, float] | None:
+        """Closest item and its great-circle distance in km, or None for an empty tree."""
+        if self._root is None:
+            return None
+        target = _to_unit_vector(lat, lon)
+        best_index = -1
+        best_sq = math.inf
+        # Each entry carries the squared distance to the split plane that led to it.
+        stack: list[tuple[_Node | None, float]] = [(self._root, 0.0)]
+        while stack:
+            node, plane_sq = stack.pop()
+            if node is None or plane_sq >= best_sq:
+                continue
+            index, axis, left, right = node
+            point = self._points[index]
+            dist_sq = (point[0] - target[0]) ** 2 + (point[1] - target[1]) ** 2 + (point[2] - target[2]) ** 2
+            if dist_sq < best_sq:
+                best_index, best_sq = index, dist_sq
+            delta = target[axis] - point[axis]
+            near, far = (left, right) if delta < 0 else (right, left)
+            # The far side can only hold a closer point if the split plane is within range.
+            stack.append((far, delta * delta))
+            stack.append((near, 0.0))
+        chord = math.sqrt(best_sq)
+        return self._items[best_index], 2 * EARTH_RADIUS_KM * math.asin(min(1.0, chord / 2))
+
+    def _build(self, indices: list[int], depth: int) -> _Node | None:
+        if not indices:
+            return None
+        axis = depth % 3
+        indices.sort(key=lambda index: self._points[index][axis])
+        middle = len(indices) // 2
+        return (
+            indices[middle],
+            axis,
+            self._build(indices[:middle], depth + 1),
+            self._build(indices[middle + 1 :], depth + 1),
+        )
+
+
+def _to_unit_vector(lat: float, lon: float) -> tuple[float, float, float]:
+    phi = math.radians(lat)
+    lam = math.radians(lon)
+    return math.cos(phi) * math.cos(lam), math.cos(phi) * math.sin(lam), math.sin(phi)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from typing import Any
+
+_SHARED_LIMITERS: dict[str, "FairRateLimiter"] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+class RateLimitExceeded(RuntimeError):
+    """Raised when a call would have to wait longer than its ``max_wait_s``."""
+
+    def __init__(self, name: str, queue_depth: int, max_wait_s: float) -> None:
+        super().__init__(f"{name} rate limit: {queue_depth} calls queued, max wait {max_wait_s:.1f}s exceeded")
+        self.name = name
+        self.queue_depth = queue_depth
+        self.max_wait_s = max_wait_s
+
+
+class FairRateLimiter:
+    """Token bucket with per-client FIFO queues served round-robin by a dispatcher thread."""
+
+    def __init__(self, name: str, rate_per_s: float, burst: int = 1) -> None:
+        self.name = name
+        self.rate_per_s = rate_per_s
+        self.burst = max(1, burst)
+        self.granted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.peak_queue_depth = 0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._queues: OrderedDict[str, deque[Future[None]]] = OrderedDict()
+        self._cond = threading.Condition()
+        self._dispatcher: threading.Thread | None = None
+
+    async def acquire(self, client_id: str, max_wait_s: float) -> float:
+        """Wait for a token; returns the seconds spent waiting."""
+        start = time.monotonic()
+        with self._cond:
+            self._refill_locked()
+            depth = self._queue_depth_locked()
+            if depth == 0 and self._tokens >= 1:
+                self._tokens -= 1
+                self.granted += 1
+                return 0.0
+            estimated_wait_s = (depth + 1 - self._tokens) / self.rate_per_s
+            if estimated_wait_s > max_wait_s:
+                self.rejected += 1
+                raise RateLimitExceeded(self.name, depth, max_wait_s)
+            future: Future[None] = Future()
+            self._queues.setdefault(client_id, deque()).append(future)
+            self.peak_queue_depth = max(self.peak_queue_depth, depth + 1)
+            self._ensure_dispatcher_locked()
+            self._cond.notify()
+        try:
+            # Cancelling the asyncio wrapper cancels `future`, which the dispatcher then skips.
+            await asyncio.wait_for(asyncio.wrap_future(future), timeout=max_wait_s)
+        except asyncio.TimeoutError:
+            with self._cond:
+                self.timed_out += 1
+                depth = self._queue_depth_locked()
+            raise RateLimitExceeded(self.name, depth, max_wait_s) from None
+        return time.monotonic() - start
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "name": self.name,
+                "rate_per_s": self.rate_per_s,
+                "queue_depth": self._queue_depth_locked(),
+                "clients_waiting": sum(1 for queue in self._queues.values() if queue),
+                "peak_queue_depth": self.peak_queue_depth,
+                "granted": self.granted,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+            }
+
+    def _dispatch(self) -> None:
+        while True:
+            with self._cond:
+                if not self._queue_depth_locked():
+                    self._cond.wait()
+                    continue
+                self._refill_locked()
+                if self._tokens < 1:
+                    self._cond.wait((1 - self._tokens) / self.rate_per_s)
+                    continue
+                future = self._next_waiter_locked()
+                # False means the waiter gave up (timed out or was cancelled); keep the token.
+                if future is None or not future.set_running_or_notify_cancel():
+                    continue
+                self._tokens -= 1
+                self.granted += 1
+            future.set_result(None)
+
+    def _next_waiter_locked(self) -> Future[None] | None:
+        # Serve the head of the first client's queue, then rotate that client to the back.
+        client_id, queue = next(iter(self._queues.items()))
+        future = queue.popleft()
+        if queue:
+            self._queues.move_to_end(client_id)
+        else:
+            del self._queues[client_id]
+        return future
+
+    def _queue_depth_locked(self) -> int:
+        return sum(1 for queue in self._queues.values() for future in queue if not future.cancelled())
+
+    def _refill_locked(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_per_s)
+        self._updated = now
+
+    def _ensure_dispatcher_locked(self) -> None:
+        if self._dispatcher is None:
+            self._dispatcher = threading.Thread(
+                target=self._dispatch,
+                name=f"rate-limiter-{self.name}",
+                daemon=True,
+            )
+            self._dispatcher.start()
+
+
+def get_rate_limiter(name: str, rate_per_s: float, burst: int = 1) -> FairRateLimiter:
+    """Return the process-wide limiter for ``name``, creating it on first use."""
+    with _SHARED_LOCK:
+        limiter = _SHARED_LIMITERS.get(name)
+        if limiter is None:
+            limiter = FairRateLimiter(name, rate_per_s, burst)
+            _SHARED_LIMITERS[name] = limiter
+        return limiter
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, TypeVar
+
+from src.core.logger import log_event
+
+T = TypeVar("T")
+
+
+# Settles a call whose leader was cancelled; followers retry instead of seeing it.
+class _LeaderCancelled(Exception):
+    pass
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into one upstream call."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.leaders = 0
+        self.coalesced = 0
+        self._in_flight: dict[str, Future[Any]] = {}
+        self._lock = threading.Lock()
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[T]], logger: Any) -> T:
+        while True:
+            with self._lock:
+                shared = self._in_flight.get(key)
+                if shared is None:
+                    shared = Future()
+                    self._in_flight[key] = shared
+                    self.leaders += 1
+                    leader = True
+                else:
+                    self.coalesced += 1
+                    leader = False
+            if leader:
+                break
+            log_event(
+                logger,
+                "DEBUG",
+                "tool_call_coalesced",
+                tool_name=self.name,
+                call_id=key,
+                stats=self.stats(),
+            )
+            try:
+                # Shield so a cancelled follower does not cancel the shared future.
+                return await asyncio.shield(asyncio.wrap_future(shared))
+            except _LeaderCancelled:
+                log_event(logger, "DEBUG", "single_flight_leader_cancelled", tool_name=self.name, call_id=key)
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            self._settle(key, shared, exc=_LeaderCancelled())
+            raise
+        except BaseException as exc:
+            self._settle(key, shared, exc=exc)
+            raise
+        self._settle(key, shared, result=result)
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "in_flight": len(self._in_flight),
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+            }
+
+    def _settle(self, key: str, shared: Future[Any], result: Any = None, exc: BaseException | None = None) -> None:
+        with self._lock:
+            self._in_flight.pop(key, None)
+        if exc is not None:
+            shared.set_exception(exc)
+        else:
+            shared.set_result(result)
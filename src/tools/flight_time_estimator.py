@@ -3,12 +3,41 @@ from __future__ import annotations
 import csv
 import math
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
+
+import numpy as np
+
+from src.core.kdtree import EARTH_RADIUS_KM, SphereKDTree
+
+# OurAirports rows kept when loading the full public dataset.
+MAJOR_AIRPORT_TYPES = {"large_airport", "medium_airport"}
+# Beyond this, the nearest airport says little about the trip; use the destination point itself.
+MAX_DESTINATION_AIRPORT_KM = 300.0
+# Beyond this the origin has no airport in the dataset; fall back to name matching, then no estimate.
+MAX_ORIGIN_AIRPORT_KM = 300.0
+# Destinations per matrix product when snapping in bulk; bounds memory at rows x airports floats.
+SNAP_CHUNK_ROWS = 512
 
 
 class FlightTimeEstimator:
+    """Estimates flight hours between airports resolved by city name or coordinates."""
+
     def __init__(self, data_path: str) -> None:
+        # Country name -> the country value stored on airports; empty when they already match.
+        self.country_aliases: dict[str, str] = {}
         self.airports = self._load_airports(data_path)
+        self.index = SphereKDTree(self.airports, [(airport["lat"], airport["lon"]) for airport in self.airports])
+        # Array copies for bulk snapping: coordinates and unit vectors, one row per airport.
+        self._airport_coords = np.array(
+            [(airport["lat"], airport["lon"]) for airport in self.airports], dtype=float
+        ).reshape(-1, 2)
+        self._airport_vectors = _unit_vectors(self._airport_coords[:, 0], self._airport_coords[:, 1])
+        # Hash indexes: (city, country) -> first airport, city -> first airport.
+        self.by_city_country: dict[tuple[str, str], dict[str, Any]] = {}
+        self.by_city: dict[str, dict[str, Any]] = {}
+        for airport in self.airports:
+            self.by_city_country.setdefault((airport["city"], airport["country"]), airport)
+            self.by_city.setdefault(airport["city"], airport)
 
     def estimate_hours(
         self,
@@ -16,46 +45,133 @@ class FlightTimeEstimator:
         origin_country: str,
         destination_lat: float,
         destination_lon: float,
+        origin_lat: float | None = None,
+        origin_lon: float | None = None,
     ) -> float | None:
-        origin = self._find_airport(origin_city, origin_country)
+        origin = self.resolve_origin(origin_city, origin_country, origin_lat, origin_lon)
         if not origin:
             return None
+        target_lat, target_lon = self._snap_destination(destination_lat, destination_lon)
         distance_km = self._haversine_km(
             origin["lat"],
             origin["lon"],
-            destination_lat,
-            destination_lon,
+            target_lat,
+            target_lon,
         )
+        return self._hours_from_km(distance_km)
+
+    def estimate_hours_many(
+        self,
+        origin: dict[str, Any] | None,
+        lats: Sequence[float],
+        lons: Sequence[float],
+    ) -> list[float | None]:
+        """Vectorized ``estimate_hours`` for one resolved origin and many destinations."""
+        if not origin:
+            return [None] * len(lats)
+        if not len(lats):
+            return []
+        snapped = self._snap_destinations(np.asarray(lats, dtype=float), np.asarray(lons, dtype=float))
+        distances = _haversine_km_many(origin["lat"], origin["lon"], snapped[:, 0], snapped[:, 1])
+        return np.round(distances / 800.0 + 0.6, 2).tolist()
+
+    def resolve_origin(
+        self,
+        city: str,
+        country: str,
+        lat: float | None = None,
+        lon: float | None = None,
+    ) -> dict[str, Any] | None:
+        # Coordinates from onboarding geocoding beat name matching, if an airport is close enough.
+        if lat is not None and lon is not None:
+            airport = self.nearest_airport(lat, lon, max_km=MAX_ORIGIN_AIRPORT_KM)
+            if airport:
+                return airport
+        return self._find_airport(city, country)
+
+    def nearest_airport(self, lat: float, lon: float, max_km: float | None = None) -> dict[str, Any] | None:
+        nearest = self.index.nearest(lat, lon)
+        if not nearest or (max_km is not None and nearest[1] > max_km):
+            return None
+        return nearest[0]
+
+    def _snap_destination(self, lat: float, lon: float) -> tuple[float, float]:
+        # Beyond MAX_DESTINATION_AIRPORT_KM the destination point itself is used.
+        nearest = self.index.nearest(lat, lon)
+        if nearest and nearest[1] <= MAX_DESTINATION_AIRPORT_KM:
+            return nearest[0]["lat"], nearest[0]["lon"]
+        return lat, lon
+
+    def _snap_destinations(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        # Bulk _snap_destination: nearest airport = largest dot product of unit vectors.
+        snapped = np.column_stack([lats, lons])
+        if not len(self._airport_vectors):
+            return snapped
+        targets = _unit_vectors(lats, lons)
+        for start in range(0, len(targets), SNAP_CHUNK_ROWS):
+            dots = targets[start : start + SNAP_CHUNK_ROWS] @ self._airport_vectors.T
+            nearest = dots.argmax(axis=1)
+            best = np.clip(dots[np.arange(len(nearest)), nearest], -1.0, 1.0)
+            close = EARTH_RADIUS_KM * np.arccos(best) <= MAX_DESTINATION_AIRPORT_KM
+            rows = np.arange(start, start + len(nearest))[close]
+            snapped[rows] = self._airport_coords[nearest[close]]
+        return snapped
+
+    def _hours_from_km(self, distance_km: float) -> float:
         return round((distance_km / 800.0) + 0.6, 2)
 
     def _load_airports(self, path: str) -> list[dict[str, Any]]:
-        airports = []
+        airports: list[dict[str, Any]] = []
         csv_path = Path(path)
         if not csv_path.exists():
             return airports
         with csv_path.open("r", encoding="utf-8") as file:
             reader = csv.DictReader(file)
+            full_dataset = "latitude_deg" in (reader.fieldnames or [])
+            if full_dataset:
+                self.country_aliases = self._load_country_codes(csv_path.with_name("countries.csv"))
             for row in reader:
-                airports.append(
-                    {
-                        "city": row["city"].lower(),
-                        "country": row["country"].lower(),
-                        "lat": float(row["lat"]),
-                        "lon": float(row["lon"]),
-                    }
-                )
+                airport = self._ourairports_row(row) if full_dataset else self._bundled_row(row)
+                if airport:
+                    airports.append(airport)
         return airports
 
+    def _bundled_row(self, row: dict[str, str]) -> dict[str, Any]:
+        return {
+            "city": row["city"].lower(),
+            "country": row["country"].lower(),
+            "iata": row.get("iata", ""),
+            "lat": float(row["lat"]),
+            "lon": float(row["lon"]),
+        }
+
+    def _ourairports_row(self, row: dict[str, str]) -> dict[str, Any] | None:
+        if row.get("type") not in MAJOR_AIRPORT_TYPES or row.get("scheduled_service") != "yes":
+            return None
+        if not row.get("municipality"):
+            return None
+        # OurAirports only carries ISO country codes (e.g. "il").
+        country_code = row.get("iso_country", "").lower()
+        return {
+            "city": row["municipality"].lower(),
+            "country": country_code,
+            "iata": row.get("iata_code", ""),
+            "lat": float(row["latitude_deg"]),
+            "lon": float(row["longitude_deg"]),
+        }
+
+    def _load_country_codes(self, path: Path) -> dict[str, str]:
+        # OurAirports countries.csv: `code,name,...`; missing file means names cannot be matched.
+        if not path.exists():
+            return {}
+        with path.open("r", encoding="utf-8") as file:
+            return {row["name"].lower(): row["code"].lower() for row in csv.DictReader(file)}
+
     def _find_airport(self, city: str, country: str) -> dict[str, Any] | None:
         city = city.lower().strip()
         country = country.lower().strip()
-        for airport in self.airports:
-            if airport["city"] == city and airport["country"] == country:
-                return airport
-        for airport in self.airports:
-            if airport["city"] == city:
-                return airport
-        return None
+        country = self.country_aliases.get(country, country)
+        return self.by_city_country.get((city, country)) or self.by_city.get(city)
 
     def _haversine_km(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         r = 6371.0
@@ -69,3 +185,19 @@ class FlightTimeEstimator:
         )
         c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
         return r * c
+
+
+def _haversine_km_many(lat1: float, lon1: float, lats2: np.ndarray, lons2: np.ndarray) -> np.ndarray:
+    lat1_rad = np.radians(lat1)
+    lats2_rad = np.radians(lats2)
+    dlat = lats2_rad - lat1_rad
+    dlon = np.radians(lons2 - lon1)
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1_rad) * np.cos(lats2_rad) * np.sin(dlon / 2) ** 2
+    return 6371.0 * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def _unit_vectors(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    phi = np.radians(lats)
+    lam = np.radians(lons)
+    cos_phi = np.cos(phi)
+    return np.column_stack([cos_phi * np.cos(lam), cos_phi * np.sin(lam), np.sin(phi)])
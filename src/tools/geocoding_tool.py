@@ -1,20 +1,76 @@
 from __future__ import annotations
 
+import os
 import time
+import uuid
 from typing import Any
 
-import requests
+import httpx
 
+from src.core.async_runtime import run_sync
+from src.core.cache import MemoryCache, PersistentCache, get_persistent_cache
+from src.core.http import ConnectionTrace, get_async_client
 from src.core.logger import log_event
+from src.core.rate_limiter import FairRateLimiter, RateLimitExceeded, get_rate_limiter
+from src.core.single_flight import SingleFlight
+
+# Place coordinates practically never change; empty answers are retried sooner.
+GEOCODE_TTL_S = 30 * 24 * 3600
+GEOCODE_NEGATIVE_TTL_S = 24 * 3600
+GEOCODE_CACHE_MAX_ENTRIES = 5000
+
+# Sessions geocoding the same query at once share one Nominatim request (and one rate-limit token).
+_IN_FLIGHT = SingleFlight("geocoding")
 
 
 class GeocodingTool:
-    def __init__(self, logger: Any) -> None:
+    def __init__(
+        self,
+        logger: Any,
+        cache: MemoryCache | PersistentCache | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        rate_limiter: FairRateLimiter | None = None,
+        client_id: str | None = None,
+    ) -> None:
         self.logger = logger
+        self.http_client = http_client
         self.url = "https://nominatim.openstreetmap.org/search"
         self.headers = {"User-Agent": "LocationRecommenderAgent/1.0"}
+        self.cache = cache or get_persistent_cache(
+            "geocoding",
+            max_entries=GEOCODE_CACHE_MAX_ENTRIES,
+            default_ttl_s=GEOCODE_TTL_S,
+        )
+        # Nominatim allows ~1 request/s per application, so every session shares one bucket.
+        # Each tool instance (one per Streamlit session) gets its own fair-share queue.
+        self.rate_limiter = rate_limiter or get_rate_limiter(
+            "nominatim",
+            rate_per_s=float(os.getenv("NOMINATIM_RATE_PER_S", "1.0")),
+        )
+        self.client_id = client_id or uuid.uuid4().hex[:8]
+        self.max_wait_s = float(os.getenv("NOMINATIM_MAX_WAIT_S", "5"))
 
     def geocode(self, place: str, limit: int = 5) -> list[dict[str, Any]]:
+        return run_sync(self.ageocode(place, limit))
+
+    async def ageocode(self, place: str, limit: int = 5) -> list[dict[str, Any]]:
+        cache_key = f"{limit}|{self._normalize_query(place)}"
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            log_event(
+                self.logger,
+                "DEBUG",
+                "tool_cache_hit",
+                tool_name="geocoding",
+                query=place,
+                limit=limit,
+                count=len(cached),
+            )
+            return cached
+        result = await _IN_FLIGHT.do(cache_key, lambda: self._fetch(place, limit, cache_key), self.logger)
+        return [dict(row) for row in result]
+
+    async def _fetch(self, place: str, limit: int, cache_key: str) -> list[dict[str, Any]]:
         start = time.time()
         params = {
             "q": place,
@@ -23,8 +79,17 @@ class GeocodingTool:
             "addressdetails": 1,
             "accept-language": "en",
         }
+        await self._acquire_slot(place)
         log_event(self.logger, "DEBUG", "tool_request", tool_name="geocoding", params=params)
-        response = requests.get(self.url, params=params, headers=self.headers, timeout=20)
+        trace = ConnectionTrace()
+        client = self.http_client or get_async_client()
+        response = await client.get(
+            self.url,
+            params=params,
+            headers=self.headers,
+            timeout=20,
+            extensions=trace.extensions(),
+        )
         response.raise_for_status()
         rows = response.json()
         result = [
@@ -37,13 +102,44 @@ class GeocodingTool:
             }
             for row in rows
         ]
+        self.cache.set(cache_key, result, ttl_s=GEOCODE_TTL_S if result else GEOCODE_NEGATIVE_TTL_S)
         log_event(
             self.logger,
             "DEBUG",
             "tool_response",
             tool_name="geocoding",
             latency_ms=int((time.time() - start) * 1000),
+            new_connections=trace.new_connections,
             count=len(result),
             response=result,
         )
         return result
+
+    async def _acquire_slot(self, place: str) -> None:
+        # Raises RateLimitExceeded instead of queueing past max_wait_s; callers pick the fallback.
+        try:
+            waited_s = await self.rate_limiter.acquire(self.client_id, self.max_wait_s)
+        except RateLimitExceeded:
+            log_event(
+                self.logger,
+                "WARN",
+                "geocoding_rate_limited",
+                query=place,
+                client_id=self.client_id,
+                max_wait_s=self.max_wait_s,
+                limiter=self.rate_limiter.stats(),
+            )
+            raise
+        if waited_s > 0:
+            log_event(
+                self.logger,
+                "DEBUG",
+                "geocoding_rate_limit_wait",
+                query=place,
+                client_id=self.client_id,
+                waited_ms=int(waited_s * 1000),
+                limiter=self.rate_limiter.stats(),
+            )
+
+    def _normalize_query(self, place: str) -> str:
+        return " ".join(place.lower().split())
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+import time
+from dataclasses import dataclass
+from typing import Any
+
+_WHITESPACE = " \t\r\n,"
+_ELEMENTS_START = re.compile(r'"elements"\s*:\s*\[')
+_REMARK = re.compile(r'"remark"\s*:\s*("(?:[^"\\]|\\.)*")')
+# Overpass appends its "remark" (e.g. a query timeout) after the array; it is short.
+MAX_TAIL_CHARS = 4096
+
+
+@dataclass
+class StreamStats:
+    bytes_read: int = 0
+    peak_buffer_chars: int = 0
+    elements: int = 0
+    parse_ms: int = 0
+    stopped_early: bool = False
+
+
+class ElementStreamParser:
+    """Incremental parser for the top-level ``elements`` array of an Overpass body."""
+
+    def __init__(self) -> None:
+        self.stats = StreamStats()
+        self.finished = False
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._in_array = False
+        self._parse_s = 0.0
+        self._tail = ""
+
+    @property
+    def tail_full(self) -> bool:
+        return len(self._tail) >= MAX_TAIL_CHARS
+
+    def feed(self, chunk: bytes) -> list[dict[str, Any]]:
+        self.stats.bytes_read += len(chunk)
+        if self.finished:
+            self._tail = (self._tail + self._decoder.decode(chunk))[:MAX_TAIL_CHARS]
+            return []
+        # Drop everything already consumed before appending.
+        self._buffer = self._buffer[self._pos :] + self._decoder.decode(chunk)
+        self._pos = 0
+        self.stats.peak_buffer_chars = max(self.stats.peak_buffer_chars, len(self._buffer))
+        return self._drain()
+
+    def close(self, complete: bool) -> StreamStats:
+        """Finish parsing; ``complete`` says whether the whole body was read."""
+        self.stats.parse_ms = int(self._parse_s * 1000)
+        self.stats.stopped_early = not complete
+        if complete and self._in_array and not self.finished:
+            raise ValueError("Overpass response ended inside the elements array")
+        return self.stats
+
+    def remark(self) -> str | None:
+        """The body's top-level ``remark`` after the elements array, if it was read."""
+        match = _REMARK.search(self._tail)
+        return json.loads(match.group(1)) if match else None
+
+    def _drain(self) -> list[dict[str, Any]]:
+        elements: list[dict[str, Any]] = []
+        if not self._in_array:
+            match = _ELEMENTS_START.search(self._buffer, self._pos)
+            if not match:
+                # Keep a short tail in case the key straddles two chunks.
+                self._pos = max(self._pos, len(self._buffer) - 32)
+                return elements
+            self._pos = match.end()
+            self._in_array = True
+        buffer = self._buffer
+        while True:
+            while self._pos < len(buffer) and buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos >= len(buffer):
+                return elements
+            if buffer[self._pos] == "]":
+                self.finished = True
+                self._tail = buffer[self._pos + 1 :][:MAX_TAIL_CHARS]
+                return elements
+            started = time.perf_counter()
+            try:
+                element, end = self._json.raw_decode(buffer, self._pos)
+            except json.JSONDecodeError:
+                # Incomplete object: wait for the next chunk.
+                self._parse_s += time.perf_counter() - started
+                return elements
+            self._parse_s += time.perf_counter() - started
+            self._pos = end
+            self.stats.elements += 1
+            elements.append(element)
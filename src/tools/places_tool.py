@@ -1,84 +1,449 @@
 from __future__ import annotations
 
+import asyncio
+import os
+import threading
 import time
-from typing import Any
+from collections import deque
+from dataclasses import asdict
+from typing import Any, Protocol
 
-import requests
+import httpx
 
+from src.core import geohash
+from src.core.async_runtime import run_sync
+from src.core.cache import PersistentCache, get_persistent_cache
+from src.core.endpoint_health import EndpointHealthRegistry
+from src.core.http import ConnectionTrace, get_async_client
 from src.core.logger import log_event
+from src.core.single_flight import SingleFlight
+from src.tools.overpass_stream import ElementStreamParser, StreamStats
+
+# POI density around a city changes slowly; a ~5 km geohash tile is well inside the 25 km query radius.
+PLACES_CACHE_TTL_S = 3 * 24 * 3600
+PLACES_CACHE_MAX_ENTRIES = 20000
+PLACES_GEOHASH_PRECISION = 5
+SEARCH_RADIUS_M = 25000
+MAX_ELEMENTS_PER_SEED = 100
+# Server-side query budget; the client waits a little longer so the server's own timeout answer arrives.
+OVERPASS_TIMEOUT_S = 25
+OVERPASS_CLIENT_TIMEOUT_S = OVERPASS_TIMEOUT_S + 5
+SAMPLE_NAME_LIMIT = 8
+STREAM_CHUNK_BYTES = 16384
+# Derived element type emitted (via `make`) ahead of each seed's output in batch queries.
+SEED_MARKER_TYPE = "seed"
+
+
+class OverpassRuntimeError(RuntimeError):
+    """Overpass answered 200 but reported a server-side runtime error (e.g. a query timeout)."""
+
+
+class ElementSink(Protocol):
+    """Receives Overpass elements as they are parsed; ``add`` returns False to stop reading."""
+
+    def add(self, element: dict[str, Any]) -> bool: ...
+
+    def result(self) -> Any: ...
+
+
+class LatencyWindow:
+    """Recent successful Overpass latencies, shared by every PlacesTool in the process."""
+
+    def __init__(self, size: int = 50, default_delay_s: float = 3.0) -> None:
+        self.default_delay_s = default_delay_s
+        self._samples: deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def record(self, latency_s: float) -> None:
+        with self._lock:
+            self._samples.append(latency_s)
+
+    def percentile(self, fraction: float) -> float | None:
+        with self._lock:
+            ordered = sorted(self._samples)
+        if not ordered:
+            return None
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def hedge_delay_s(self) -> float:
+        # p90 once there is enough history; before that, twice the median or a fixed default.
+        with self._lock:
+            count = len(self._samples)
+        if count >= 10:
+            delay = self.percentile(0.9) or self.default_delay_s
+        elif count >= 3:
+            delay = 2 * (self.percentile(0.5) or self.default_delay_s)
+        else:
+            delay = self.default_delay_s
+        return max(0.5, min(10.0, delay))
+
+
+_LATENCIES = LatencyWindow()
+# Process-wide mirror health.
+_MIRROR_HEALTH = EndpointHealthRegistry()
+# Identical tile/tag queries from concurrent sessions share one Overpass request.
+_IN_FLIGHT = SingleFlight("places")
 
 
 class PlacesTool:
-    def __init__(self, logger: Any) -> None:
+    def __init__(
+        self,
+        logger: Any,
+        cache: PersistentCache | None = None,
+        health: EndpointHealthRegistry | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         self.logger = logger
+        self.http_client = http_client
+        self.cache = cache or get_persistent_cache(
+            "places",
+            max_entries=PLACES_CACHE_MAX_ENTRIES,
+            default_ttl_s=PLACES_CACHE_TTL_S,
+        )
         self.urls = [
             "https://overpass-api.de/api/interpreter",
             "https://overpass.kumi.systems/api/interpreter",
             "https://lz4.overpass-api.de/api/interpreter",
         ]
-        self.overpass_backoff_until = 0.0
+        self.health = health or _MIRROR_HEALTH
+        # Hedged mode races mirrors instead of waiting out each timeout in turn.
+        self.hedging = os.getenv("PLACES_HEDGING", "true").lower() == "true"
 
-    def fetch_activity_signals(self, lat: float, lon: float, activity: str | None) -> dict[str, Any]:
-        start = time.time()
-        if time.time() < self.overpass_backoff_until:
-            fallback = self._fallback_result(activity)
-            log_event(
-                self.logger,
-                "WARN",
-                "places_backoff_active",
-                backoff_until=self.overpass_backoff_until,
-                fallback=fallback,
-            )
-            return fallback
+    def fetch_activity_signals(
+        self,
+        lat: float,
+        lon: float,
+        activity: str | None,
+        include_names: bool = True,
+    ) -> dict[str, Any]:
+        return run_sync(self.afetch_activity_signals(lat, lon, activity, include_names))
+
+    def fetch_activity_signals_batch(
+        self,
+        points: list[tuple[float, float]],
+        activity: str | None,
+    ) -> list[dict[str, Any]]:
+        return run_sync(self.afetch_activity_signals_batch(points, activity))
+
+    async def afetch_activity_signals(
+        self,
+        lat: float,
+        lon: float,
+        activity: str | None,
+        include_names: bool = True,
+    ) -> dict[str, Any]:
+        # include_names=False asks Overpass for `out count`, so no element bodies are transferred.
         tag = self._activity_tag(activity)
+        cached = self._cached_signals(lat, lon, tag)
+        if cached is None and not include_names:
+            cached = self._cached_signals(lat, lon, tag, variant="count")
+        if cached is not None:
+            return cached
+        if self._backoff_active(activity):
+            return self._fallback_result(activity)
+        tile = geohash.encode(lat, lon, PLACES_GEOHASH_PRECISION)
+        cache_key = self._cache_key(tile, tag, variant="full" if include_names else "count")
+        result = await _IN_FLIGHT.do(
+            cache_key,
+            lambda: self._fetch_signals(lat, lon, activity, tag, include_names, cache_key),
+            self.logger,
+        )
+        return dict(result)
+
+    async def _fetch_signals(
+        self,
+        lat: float,
+        lon: float,
+        activity: str | None,
+        tag: str,
+        include_names: bool,
+        cache_key: str,
+    ) -> dict[str, Any]:
+        start = time.time()
+        out = f"out center {MAX_ELEMENTS_PER_SEED};" if include_names else "out count;"
         query = (
-            "[out:json][timeout:25];"
-            f"(node(around:25000,{lat},{lon})[{tag}];"
-            f"way(around:25000,{lat},{lon})[{tag}];);"
-            "out center 100;"
+            f"[out:json][timeout:{OVERPASS_TIMEOUT_S}];"
+            f"(node(around:{SEARCH_RADIUS_M},{lat},{lon})[{tag}];"
+            f"way(around:{SEARCH_RADIUS_M},{lat},{lon})[{tag}];);"
+            f"{out}"
         )
-        for index, url in enumerate(self.urls):
+        sink_factory = _SummarySink if include_names else _CountSink
+        outcome = await self._run_query(query, tool_name="places", sink_factory=sink_factory)
+        if outcome is None:
+            return self._log_fallback(activity)
+        result, endpoint, stats = outcome
+        self.cache.set(cache_key, result)
+        log_event(
+            self.logger,
+            "DEBUG",
+            "tool_response",
+            tool_name="places",
+            endpoint=endpoint,
+            latency_ms=int((time.time() - start) * 1000),
+            count_only=not include_names,
+            **asdict(stats),
+            response=result,
+        )
+        return result
+
+    async def afetch_activity_signals_batch(
+        self,
+        points: list[tuple[float, float]],
+        activity: str | None,
+    ) -> list[dict[str, Any]]:
+        # One union Overpass query for every uncached point; results keep the order of `points`.
+        tag = self._activity_tag(activity)
+        results: list[dict[str, Any] | None] = [self._cached_signals(lat, lon, tag) for lat, lon in points]
+        missing = [index for index, row in enumerate(results) if row is None]
+        if not missing:
+            return results  # type: ignore[return-value]
+        if self._backoff_active(activity):
+            return [row or self._fallback_result(activity) for row in results]
+        tiles = [geohash.encode(points[index][0], points[index][1], PLACES_GEOHASH_PRECISION) for index in missing]
+        rows = await _IN_FLIGHT.do(
+            f"batch|{tag}|" + ";".join(tiles),
+            lambda: self._fetch_signals_batch([points[index] for index in missing], activity, tag),
+            self.logger,
+        )
+        for index, row in zip(missing, rows):
+            results[index] = dict(row)
+        return results  # type: ignore[return-value]
+
+    async def _fetch_signals_batch(
+        self,
+        points: list[tuple[float, float]],
+        activity: str | None,
+        tag: str,
+    ) -> list[dict[str, Any]]:
+        start = time.time()
+
+        # One named set per seed, each with its own capped output. A `make` marker element
+        # precedes every set's output, so elements are attributed by stream position.
+        statements = "".join(
+            f'make {SEED_MARKER_TYPE} index="{index}";out;'
+            f"(node(around:{SEARCH_RADIUS_M},{lat},{lon})[{tag}];"
+            f"way(around:{SEARCH_RADIUS_M},{lat},{lon})[{tag}];)->.s{index};"
+            f".s{index} out center {MAX_ELEMENTS_PER_SEED};"
+            for index, (lat, lon) in enumerate(points)
+        )
+        query = f"[out:json][timeout:{OVERPASS_TIMEOUT_S}];{statements}"
+        outcome = await self._run_query(query, tool_name="places_batch", sink_factory=_SeedSink)
+        if outcome is None:
+            fallback = self._log_fallback(activity)
+            return [dict(fallback) for _ in points]
+        per_seed, endpoint, stats = outcome
+
+        rows: list[dict[str, Any]] = []
+        missing = [index for index in range(len(points)) if index not in per_seed]
+        if missing:
+            log_event(self.logger, "WARN", "places_batch_incomplete", endpoint=endpoint, missing_seeds=missing)
+        for index, (lat, lon) in enumerate(points):
+            if index not in per_seed:
+                # No marker means the seed's output never arrived; a zero here would be cached as fact.
+                rows.append(dict(self._fallback_result(activity)))
+                continue
+            result = per_seed[index]
+            self.cache.set(self._cache_key(geohash.encode(lat, lon, PLACES_GEOHASH_PRECISION), tag), result)
+            rows.append(result)
+        log_event(
+            self.logger,
+            "DEBUG",
+            "tool_response",
+            tool_name="places_batch",
+            endpoint=endpoint,
+            latency_ms=int((time.time() - start) * 1000),
+            points=len(points),
+            **asdict(stats),
+            response=rows,
+        )
+        return rows
+
+    async def _run_query(
+        self,
+        query: str,
+        tool_name: str,
+        sink_factory: type[ElementSink],
+    ) -> tuple[Any, str, StreamStats] | None:
+        # Returns (sink result, endpoint, parse stats), or None when every mirror failed.
+        # Each attempt feeds elements into a fresh sink straight off the wire.
+        urls = self.health.ordered(self.urls, self.logger)
+        if self.hedging and len(urls) > 1:
+            return await self._run_query_hedged(urls, query, tool_name, sink_factory)
+        for index, url in enumerate(urls):
+            if not self.health.try_acquire(url):
+                continue
             try:
-                log_event(
-                    self.logger,
-                    "DEBUG",
-                    "tool_request",
-                    tool_name="places",
-                    endpoint=url,
-                    query=query,
-                    attempt=index + 1,
+                return await self._attempt(url, index + 1, query, tool_name, sink_factory)
+            except Exception:  # noqa: BLE001
+                if index < len(urls) - 1:
+                    await asyncio.sleep(0.4 * (index + 1))
+        return None
+
+    async def _run_query_hedged(
+        self,
+        urls: list[str],
+        query: str,
+        tool_name: str,
+        sink_factory: type[ElementSink],
+    ) -> tuple[Any, str, StreamStats] | None:
+        # Start on the healthiest mirror; if it has not answered within the hedge delay (or fails),
+        # fire the next one. The first success wins and the losers are cancelled.
+        hedge_delay_s = _LATENCIES.hedge_delay_s()
+        pending: dict[asyncio.Task[tuple[Any, str, StreamStats]], tuple[str, int]] = {}
+        remaining = list(urls)
+        attempts = 0
+
+        def launch() -> str | None:
+            nonlocal attempts
+            while remaining:
+                url = remaining.pop(0)
+                if not self.health.try_acquire(url):
+                    continue
+                attempts += 1
+                task = asyncio.create_task(self._attempt(url, attempts, query, tool_name, sink_factory))
+                pending[task] = (url, attempts)
+                return url
+            return None
+
+        launch()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    list(pending),
+                    timeout=hedge_delay_s if remaining else None,
+                    return_when=asyncio.FIRST_COMPLETED,
                 )
-                response = requests.post(url, data={"data": query}, timeout=30)
+                if not done:
+                    hedge_url = launch()
+                    if hedge_url:
+                        log_event(
+                            self.logger,
+                            "INFO",
+                            "places_hedge_fired",
+                            hedge_delay_ms=int(hedge_delay_s * 1000),
+                            endpoint=hedge_url,
+                            in_flight=len(pending),
+                        )
+                    continue
+                for task in done:
+                    url, attempt = pending.pop(task)
+                    if task.exception() is not None:
+                        continue
+                    if attempt > 1 or pending:
+                        log_event(
+                            self.logger,
+                            "INFO",
+                            "places_hedge_won",
+                            endpoint=url,
+                            attempt=attempt,
+                            abandoned=len(pending),
+                        )
+                    return task.result()
+                # Every finished attempt failed: move to the next mirror without waiting.
+                launch()
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _attempt(
+        self,
+        url: str,
+        attempt: int,
+        query: str,
+        tool_name: str,
+        sink_factory: type[ElementSink],
+    ) -> tuple[Any, str, StreamStats]:
+        # Records the outcome in the shared health registry before returning or re-raising.
+        log_event(
+            self.logger,
+            "DEBUG",
+            "tool_request",
+            tool_name=tool_name,
+            endpoint=url,
+            query=query,
+            attempt=attempt,
+        )
+        start = time.time()
+        trace = ConnectionTrace()
+        parser = ElementStreamParser()
+        sink = sink_factory()
+        try:
+            client = self.http_client or get_async_client()
+            async with client.stream(
+                "POST",
+                url,
+                data={"data": query},
+                timeout=OVERPASS_CLIENT_TIMEOUT_S,
+                extensions=trace.extensions(),
+            ) as response:
                 response.raise_for_status()
-                data = response.json()
-                elements = data.get("elements", [])
-                result = {"poi_count": len(elements), "sample_names": self._sample_names(elements)}
-                log_event(
-                    self.logger,
-                    "DEBUG",
-                    "tool_response",
-                    tool_name="places",
-                    endpoint=url,
-                    latency_ms=int((time.time() - start) * 1000),
-                    response=result,
-                )
-                return result
-            except Exception as exc:  # noqa: BLE001
-                log_event(
-                    self.logger,
-                    "WARN",
-                    "places_endpoint_failed",
-                    endpoint=url,
-                    attempt=index + 1,
-                    error=str(exc),
-                )
-                # If service is throttling or timing out, avoid hammering for the next minute.
-                err = str(exc).lower()
-                if "429" in err or "timeout" in err or "timed out" in err or "504" in err:
-                    self.overpass_backoff_until = max(self.overpass_backoff_until, time.time() + 60)
-                if index < len(self.urls) - 1:
-                    time.sleep(0.4 * (index + 1))
+                wants_more = True
+                async for chunk in response.aiter_bytes(STREAM_CHUNK_BYTES):
+                    for element in parser.feed(chunk):
+                        wants_more = sink.add(element)
+                        if not wants_more:
+                            break
+                    if not wants_more or parser.tail_full:
+                        # Leaving the block closes the response without reading the rest.
+                        break
+                stats = parser.close(complete=wants_more or parser.finished)
+            # A server-side timeout still answers 200, with partial elements and a trailing remark.
+            remark = parser.remark()
+            if remark and "runtime error" in remark:
+                raise OverpassRuntimeError(remark)
+        except asyncio.CancelledError:
+            self.health.release(url)
+            log_event(self.logger, "DEBUG", "places_hedge_cancelled", endpoint=url, attempt=attempt)
+            raise
+        except Exception as exc:  # noqa: BLE001
+            self._record_failure(url, attempt, exc)
+            raise
+        latency_s = time.time() - start
+        _LATENCIES.record(latency_s)
+        self.health.record_success(url, latency_s, self.logger)
+        log_event(
+            self.logger,
+            "DEBUG",
+            "overpass_attempt_completed",
+            endpoint=url,
+            attempt=attempt,
+            latency_ms=int(latency_s * 1000),
+            new_connections=trace.new_connections,
+        )
+        return sink.result(), url, stats
+
+    def _record_failure(self, url: str, attempt: int, exc: Exception) -> None:
+        reason, counts_against_endpoint, trip_now = _classify_failure(exc)
+        log_event(
+            self.logger,
+            "WARN",
+            "places_endpoint_failed",
+            endpoint=url,
+            attempt=attempt,
+            reason=reason,
+            error=str(exc),
+        )
+        if counts_against_endpoint:
+            self.health.record_failure(url, reason, self.logger, trip_now=trip_now)
+        else:
+            self.health.release(url)
 
+    def _backoff_active(self, activity: str | None) -> bool:
+        # True when every mirror's breaker is open, so the fallback is used without a request.
+        if self.health.ordered(self.urls, self.logger):
+            return False
+        log_event(
+            self.logger,
+            "WARN",
+            "places_backoff_active",
+            backoff_until=self.health.next_retry_at(self.urls),
+            mirrors=self.health.snapshot(),
+            fallback=self._fallback_result(activity),
+        )
+        return True
+
+    def _log_fallback(self, activity: str | None) -> dict[str, Any]:
         fallback = self._fallback_result(activity)
         log_event(
             self.logger,
@@ -88,6 +453,36 @@ class PlacesTool:
         )
         return fallback
 
+    def _cached_signals(
+        self,
+        lat: float,
+        lon: float,
+        tag: str,
+        variant: str = "full",
+    ) -> dict[str, Any] | None:
+        # Own tile first, then the surrounding ones: their 25 km circles overlap almost entirely.
+        own = geohash.encode(lat, lon, PLACES_GEOHASH_PRECISION)
+        for tile in [own, *geohash.neighbors(lat, lon, PLACES_GEOHASH_PRECISION)]:
+            cached = self.cache.get(self._cache_key(tile, tag, variant))
+            if cached is not None:
+                log_event(
+                    self.logger,
+                    "DEBUG",
+                    "tool_cache_hit",
+                    tool_name="places",
+                    tile=tile,
+                    neighbor=tile != own,
+                    tag=tag,
+                    variant=variant,
+                )
+                return cached
+        return None
+
+    def _cache_key(self, tile: str, tag: str, variant: str = "full") -> str:
+        if variant == "full":
+            return f"{tag}|{tile}"
+        return f"{tag}|{tile}|{variant}"
+
     def _activity_tag(self, activity: str | None) -> str:
         if not activity:
             return '"tourism"'
@@ -100,15 +495,6 @@ class PlacesTool:
             return '"tourism"="museum"'
         return '"tourism"'
 
-    def _sample_names(self, elements: list[dict[str, Any]]) -> list[str]:
-        names = []
-        for element in elements[:8]:
-            tags = element.get("tags", {})
-            name = tags.get("name")
-            if name:
-                names.append(name)
-        return names
-
     def _fallback_result(self, activity: str | None) -> dict[str, Any]:
         if activity and "ski" in activity.lower():
             return {
@@ -124,3 +510,78 @@ class PlacesTool:
             "poi_count": 4,
             "sample_names": ["City Museum", "Old Town Center", "Central Park", "Water Park"],
         }
+
+
+def _classify_failure(exc: Exception) -> tuple[str, bool, bool]:
+    """(reason, counts against the endpoint, open its breaker immediately)."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        if status == 429:
+            return "rate_limited", True, True
+        if status >= 500:
+            return f"http_{status}", True, False
+        # Other 4xx answers mean the query itself was rejected, not that the mirror is unhealthy.
+        return f"http_{status}", False, False
+    if isinstance(exc, OverpassRuntimeError):
+        return "server_runtime_error", True, False
+    if isinstance(exc, httpx.TimeoutException):
+        return "timeout", True, False
+    if isinstance(exc, httpx.TransportError):
+        return "connection_error", True, False
+    return "invalid_response", True, False
+
+
+class _SummarySink:
+    """Counts up to MAX_ELEMENTS_PER_SEED elements and keeps the first few names."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.names: list[str] = []
+
+    def add(self, element: dict[str, Any]) -> bool:
+        self.count += 1
+        name = element.get("tags", {}).get("name")
+        if name and len(self.names) < SAMPLE_NAME_LIMIT:
+            self.names.append(name)
+        return self.count < MAX_ELEMENTS_PER_SEED
+
+    def result(self) -> dict[str, Any]:
+        return {"poi_count": self.count, "sample_names": self.names}
+
+
+class _CountSink:
+    """Reads the single {"type": "count", "tags": {"total": "..."}} element of `out count`."""
+
+    def __init__(self) -> None:
+        self.total = 0
+
+    def add(self, element: dict[str, Any]) -> bool:
+        self.total = int(element.get("tags", {}).get("total", 0))
+        return False
+
+    def result(self) -> dict[str, Any]:
+        return {"poi_count": min(self.total, MAX_ELEMENTS_PER_SEED), "sample_names": []}
+
+
+class _SeedSink:
+    """Splits a per-seed batch response at its marker elements into one summary per seed index."""
+
+    def __init__(self) -> None:
+        self.summaries: dict[int, dict[str, Any]] = {}
+        self.current: dict[str, Any] | None = None
+
+    def add(self, element: dict[str, Any]) -> bool:
+        if element.get("type") == SEED_MARKER_TYPE:
+            self.current = {"poi_count": 0, "sample_names": []}
+            self.summaries[int(element.get("tags", {}).get("index", len(self.summaries)))] = self.current
+            return True
+        if self.current is None:
+            return True
+        self.current["poi_count"] += 1
+        name = element.get("tags", {}).get("name")
+        if name and len(self.current["sample_names"]) < SAMPLE_NAME_LIMIT:
+            self.current["sample_names"].append(name)
+        return True
+
+    def result(self) -> dict[int, dict[str, Any]]:
+        return self.summaries
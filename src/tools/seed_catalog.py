@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+DEFAULT_CATALOG_PATH = Path(__file__).resolve().parents[2] / "data" / "seed_destinations.json"
+
+# Source list for the bundled catalog; order is the order candidates are shown in.
+SEED_DESTINATIONS: list[dict[str, Any]] = [
+    {"name": "Innsbruck", "query": "Innsbruck, Austria", "tags": ["skiing", "mountains"]},
+    {"name": "Aspen", "query": "Aspen, Colorado, United States", "tags": ["skiing", "mountains"]},
+    {"name": "Chamonix", "query": "Chamonix, France", "tags": ["skiing", "mountains"]},
+    {"name": "Sapporo", "query": "Sapporo, Japan", "tags": ["skiing", "city"]},
+    {"name": "Queenstown", "query": "Queenstown, New Zealand", "tags": ["skiing", "mountains"]},
+    {"name": "Lisbon", "query": "Lisbon, Portugal", "tags": ["discovery", "city", "beach"]},
+    {"name": "Bangkok", "query": "Bangkok, Thailand", "tags": ["discovery", "city"]},
+    {"name": "Tokyo", "query": "Tokyo, Japan", "tags": ["discovery", "city"]},
+    {"name": "Cape Town", "query": "Cape Town, South Africa", "tags": ["discovery", "city", "beach"]},
+    {"name": "Vancouver", "query": "Vancouver, Canada", "tags": ["discovery", "city", "mountains"]},
+    {"name": "Buenos Aires", "query": "Buenos Aires, Argentina", "tags": ["discovery", "city"]},
+]
+
+
+class SeedCatalog:
+    """Precompiled coordinates for the fixed discovery seeds, read from disk."""
+
+    def __init__(self, path: str | Path = DEFAULT_CATALOG_PATH) -> None:
+        self.path = Path(path)
+        self.entries = self._load(self.path)
+
+    def seeds_for_tag(self, tag: str) -> list[dict[str, Any]]:
+        # Same row shape as GeocodingTool.geocode so callers can use either source.
+        return [
+            {
+                "name": entry["name"],
+                "lat": entry["lat"],
+                "lon": entry["lon"],
+                "address": {},
+                "country_code": entry["country_code"],
+                "tags": list(entry["tags"]),
+            }
+            for entry in self.entries
+            if tag in entry["tags"]
+        ]
+
+    def _load(self, path: Path) -> list[dict[str, Any]]:
+        if not path.exists():
+            return []
+        with path.open("r", encoding="utf-8") as file:
+            return json.load(file).get("destinations", [])
+
+
+def rebuild_catalog(geocoding_tool: Any, path: str | Path = DEFAULT_CATALOG_PATH) -> list[dict[str, Any]]:
+    """Re-geocode every seed and rewrite the catalog file; meant to run offline."""
+    entries = []
+    for seed in SEED_DESTINATIONS:
+        rows = geocoding_tool.geocode(seed["query"], limit=1)
+        if not rows:
+            raise RuntimeError(f"Could not geocode seed destination: {seed['query']}")
+        entries.append(
+            {
+                "name": seed["name"],
+                "lat": round(rows[0]["lat"], 4),
+                "lon": round(rows[0]["lon"], 4),
+                "country_code": rows[0].get("country_code", ""),
+                "tags": seed["tags"],
+            }
+        )
+    payload = {"generated_at": time.strftime("%Y-%m-%d"), "destinations": entries}
+    with Path(path).open("w", encoding="utf-8") as file:
+        json.dump(payload, file, indent=2)
+        file.write("\n")
+    return entries
+
+
+if __name__ == "__main__":
+    # Usage: python -m src.tools.seed_catalog
+    from src.core.cache import MemoryCache
+    from src.core.logger import setup_logger
+    from src.tools.geocoding_tool import GeocodingTool
+
+    # A private, empty cache: every seed is looked up fresh instead of from the 30-day cache.
+    fresh_cache = MemoryCache(max_entries=len(SEED_DESTINATIONS))
+    rebuilt = rebuild_catalog(GeocodingTool(setup_logger(), cache=fresh_cache))
+    print(f"Wrote {len(rebuilt)} destinations to {DEFAULT_CATALOG_PATH}")
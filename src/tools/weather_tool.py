@@ -1,23 +1,80 @@
 from __future__ import annotations
 
 import datetime as dt
+import os
 import time
 from typing import Any
 
-import requests
-from requests import HTTPError
+import httpx
 
+from src.core.async_runtime import run_sync
+from src.core.cache import MemoryCache
+from src.core.http import ConnectionTrace, get_async_client
 from src.core.logger import log_event
+from src.core.single_flight import SingleFlight
+
+# Open-Meteo forecasts reach 16 days ahead; later dates always use the seasonal fallback.
+FORECAST_HORIZON_DAYS = 16
+
+_WEATHER_CACHE = MemoryCache(max_entries=4000)
+# Concurrent sessions asking for the same grid cell and date share one request.
+_IN_FLIGHT = SingleFlight("weather")
 
 
 class WeatherTool:
-    def __init__(self, logger: Any) -> None:
+    def __init__(
+        self,
+        logger: Any,
+        cache: MemoryCache | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         self.logger = logger
+        self.http_client = http_client
         self.url = "https://api.open-meteo.com/v1/forecast"
+        self.cache = cache or _WEATHER_CACHE
+        self.grid_deg = float(os.getenv("WEATHER_CACHE_GRID_DEG", "0.1"))
 
     def fetch_weather_score(self, lat: float, lon: float, travel_date_or_month: str) -> dict[str, Any]:
-        start = time.time()
+        return run_sync(self.afetch_weather_score(lat, lon, travel_date_or_month))
+
+    def fetch_weather_scores_batch(
+        self,
+        points: list[tuple[float, float]],
+        travel_date_or_month: str,
+    ) -> list[dict[str, Any]]:
+        return run_sync(self.afetch_weather_scores_batch(points, travel_date_or_month))
+
+    async def afetch_weather_score(self, lat: float, lon: float, travel_date_or_month: str) -> dict[str, Any]:
         target_date = self._normalize_date(travel_date_or_month)
+        cache_key = self._cache_key(lat, lon, target_date)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            log_event(
+                self.logger,
+                "DEBUG",
+                "tool_cache_hit",
+                tool_name="weather",
+                cell=cache_key,
+                stats=self.cache.stats(),
+            )
+            return dict(cached)
+        result = await _IN_FLIGHT.do(
+            cache_key,
+            lambda: self._fetch_point(lat, lon, travel_date_or_month, target_date, cache_key),
+            self.logger,
+        )
+        return dict(result)
+
+    async def _fetch_point(
+        self,
+        lat: float,
+        lon: float,
+        travel_date_or_month: str,
+        target_date: str,
+        cache_key: str,
+    ) -> dict[str, Any]:
+        start = time.time()
+        used_fallback = False
         params = {
             "latitude": lat,
             "longitude": lon,
@@ -27,8 +84,10 @@ class WeatherTool:
             "end_date": target_date,
         }
         log_event(self.logger, "DEBUG", "tool_request", tool_name="weather", params=params)
+        trace = ConnectionTrace()
         try:
-            response = requests.get(self.url, params=params, timeout=20)
+            client = self.http_client or get_async_client()
+            response = await client.get(self.url, params=params, timeout=20, extensions=trace.extensions())
             response.raise_for_status()
             data = response.json()
 
@@ -36,7 +95,8 @@ class WeatherTool:
             max_temp = float(daily.get("temperature_2m_max", [25])[0])
             min_temp = float(daily.get("temperature_2m_min", [15])[0])
             rain = float(daily.get("precipitation_sum", [0])[0])
-        except HTTPError as exc:
+        except httpx.HTTPStatusError as exc:
+            used_fallback = True
             fallback = self._seasonal_fallback(travel_date_or_month)
             log_event(
                 self.logger,
@@ -51,6 +111,7 @@ class WeatherTool:
             min_temp = fallback["min_temp"]
             rain = fallback["rain"]
         except Exception as exc:  # noqa: BLE001
+            used_fallback = True
             fallback = self._seasonal_fallback(travel_date_or_month)
             log_event(
                 self.logger,
@@ -70,9 +131,173 @@ class WeatherTool:
             "tool_response",
             tool_name="weather",
             latency_ms=int((time.time() - start) * 1000),
+            new_connections=trace.new_connections,
             response={"max_temp": max_temp, "min_temp": min_temp, "rain": rain},
         )
-        return {"max_temp": max_temp, "min_temp": min_temp, "rain": rain}
+        result = {"max_temp": max_temp, "min_temp": min_temp, "rain": rain}
+        self._store(cache_key, target_date, result, used_fallback)
+        return result
+
+    async def afetch_weather_scores_batch(
+        self,
+        points: list[tuple[float, float]],
+        travel_date_or_month: str,
+    ) -> list[dict[str, Any]]:
+        # One Open-Meteo request for every point; results keep the order of `points`.
+        if not points:
+            return []
+        target_date = self._normalize_date(travel_date_or_month)
+        keys = [self._cache_key(lat, lon, target_date) for lat, lon in points]
+        results: list[dict[str, Any] | None] = []
+        for key in keys:
+            cached = self.cache.get(key)
+            results.append(dict(cached) if cached is not None else None)
+        missing = [index for index, row in enumerate(results) if row is None]
+        if not missing:
+            log_event(
+                self.logger,
+                "DEBUG",
+                "tool_cache_hit",
+                tool_name="weather_batch",
+                points=len(points),
+                stats=self.cache.stats(),
+            )
+            return results  # type: ignore[return-value]
+        # Sessions asking for the same uncached cells on the same date share one request.
+        flight_key = "batch|" + ";".join(keys[index] for index in missing)
+        rows = await _IN_FLIGHT.do(
+            flight_key,
+            lambda: self._fetch_batch(
+                [points[index] for index in missing],
+                [keys[index] for index in missing],
+                travel_date_or_month,
+                target_date,
+            ),
+            self.logger,
+        )
+        for index, row in zip(missing, rows):
+            results[index] = dict(row)
+        return results  # type: ignore[return-value]
+
+    async def _fetch_batch(
+        self,
+        points: list[tuple[float, float]],
+        keys: list[str],
+        travel_date_or_month: str,
+        target_date: str,
+    ) -> list[dict[str, Any]]:
+        start = time.time()
+        params = {
+            "latitude": ",".join(str(lat) for lat, _ in points),
+            "longitude": ",".join(str(lon) for _, lon in points),
+            "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum",
+            "timezone": "auto",
+            "start_date": target_date,
+            "end_date": target_date,
+        }
+        log_event(
+            self.logger,
+            "DEBUG",
+            "tool_request",
+            tool_name="weather_batch",
+            points=len(points),
+            params=params,
+        )
+        trace = ConnectionTrace()
+        try:
+            client = self.http_client or get_async_client()
+            response = await client.get(self.url, params=params, timeout=20, extensions=trace.extensions())
+            response.raise_for_status()
+            data = response.json()
+            # Open-Meteo returns a bare object (not a list) for a single location.
+            locations = data if isinstance(data, list) else [data]
+        except Exception as exc:  # noqa: BLE001
+            status_code = getattr(getattr(exc, "response", None), "status_code", None)
+            log_event(
+                self.logger,
+                "WARN",
+                "weather_batch_failed",
+                error=str(exc),
+                status_code=status_code,
+                target_date=target_date,
+                points=len(points),
+            )
+            locations = []
+
+        fallback_points = 0
+        rows: list[dict[str, Any]] = []
+        for position, (lat, lon) in enumerate(points):
+            location = locations[position] if position < len(locations) else None
+            parsed = self._parse_daily(location)
+            used_fallback = parsed is None
+            if parsed is None:
+                parsed = self._seasonal_fallback(travel_date_or_month)
+                fallback_points += 1
+                log_event(
+                    self.logger,
+                    "WARN",
+                    "weather_fallback_used",
+                    reason="batch_point_missing_or_invalid",
+                    lat=lat,
+                    lon=lon,
+                    target_date=target_date,
+                    fallback=parsed,
+                )
+            self._store(keys[position], target_date, parsed, used_fallback)
+            rows.append(parsed)
+
+        log_event(
+            self.logger,
+            "DEBUG",
+            "tool_response",
+            tool_name="weather_batch",
+            latency_ms=int((time.time() - start) * 1000),
+            new_connections=trace.new_connections,
+            points=len(points),
+            fallback_points=fallback_points,
+            response=rows,
+        )
+        return rows
+
+    def _cache_key(self, lat: float, lon: float, target_date: str) -> str:
+        # Snap to the grid so nearby coordinates (e.g. two geocodes of one city) share an entry.
+        snapped_lat = round(lat / self.grid_deg) * self.grid_deg
+        snapped_lon = round(lon / self.grid_deg) * self.grid_deg
+        return f"{snapped_lat:.3f},{snapped_lon:.3f}|{target_date}"
+
+    def _cache_ttl_s(self, target_date: str) -> float:
+        days_ahead = (dt.date.fromisoformat(target_date) - dt.date.today()).days
+        if not self._in_forecast_window(days_ahead):
+            # Past dates (e.g. a month name already behind us this year) and far-out dates do not change.
+            return 7 * 24 * 3600.0
+        if days_ahead <= 2:
+            return 3600.0
+        if days_ahead <= 7:
+            return 3 * 3600.0
+        return 12 * 3600.0
+
+    def _store(self, key: str, target_date: str, result: dict[str, Any], used_fallback: bool) -> None:
+        days_ahead = (dt.date.fromisoformat(target_date) - dt.date.today()).days
+        # A fallback inside the forecast window means the API failed; retry it next time.
+        if used_fallback and self._in_forecast_window(days_ahead):
+            return
+        self.cache.set(key, dict(result), ttl_s=self._cache_ttl_s(target_date))
+
+    def _in_forecast_window(self, days_ahead: int) -> bool:
+        return 0 <= days_ahead <= FORECAST_HORIZON_DAYS
+
+    def _parse_daily(self, location: Any) -> dict[str, float] | None:
+        if not isinstance(location, dict) or location.get("error"):
+            return None
+        daily = location.get("daily") or {}
+        try:
+            return {
+                "max_temp": float(daily["temperature_2m_max"][0]),
+                "min_temp": float(daily["temperature_2m_min"][0]),
+                "rain": float(daily["precipitation_sum"][0]),
+            }
+        except (KeyError, IndexError, TypeError, ValueError):
+            return None
 
     def _normalize_date(self, value: str) -> str:
         months = {